@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compare memory per tracked lineage event: event dicts as parsed from
+JSON versus LineageEvent objects.
+
+    python benchmarks/bench_event_memory.py --events 10000
+"""
+import argparse
+import json
+import tracemalloc
+from pathlib import Path
+import sys
+
+# Add repo root so Python can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.core import RootDeriver, signing_key_from_seed_hex
+from coldroot.event import LineageEvent
+from coldroot.lineage import make_lineage_event
+
+SEED_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+
+
+def build_lines(count: int):
+    root_sk = signing_key_from_seed_hex(SEED_HEX)
+    deriver = RootDeriver.from_hex(SEED_HEX)
+    lines = []
+    for i in range(count):
+        _, epoch_vk = deriver.derive(f"epoch-{i}")
+        lines.append(json.dumps(make_lineage_event(root_sk, epoch_vk, f"epoch-{i}", created_at=i)))
+    return lines
+
+
+def measure(build):
+    tracemalloc.start()
+    held = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    args = parser.parse_args()
+
+    lines = build_lines(args.events)
+    _, dict_bytes = measure(lambda: [json.loads(line) for line in lines])
+    _, compact_bytes = measure(lambda: [LineageEvent.from_dict(json.loads(line)) for line in lines])
+
+    n = args.events
+    print(f"events:       {n}")
+    print(f"dict:         {dict_bytes / n:8.0f} bytes/event")
+    print(f"LineageEvent: {compact_bytes / n:8.0f} bytes/event  ({dict_bytes / compact_bytes:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
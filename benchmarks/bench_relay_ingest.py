@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Load-test the relay ingestion pipeline against the in-process LocalRelay,
+with no network involved.
+
+    python benchmarks/bench_relay_ingest.py --events 20000 --threads 4
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+# Add repo root so Python can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.core import RootDeriver, signing_key_from_seed_hex
+from coldroot.lineage import make_lineage_event
+from coldroot.relay import LineageIngestor, LocalRelay
+
+SEED_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+
+
+def build_events(count: int):
+    root_sk = signing_key_from_seed_hex(SEED_HEX)
+    deriver = RootDeriver.from_hex(SEED_HEX)
+    events = []
+    for i in range(count):
+        _, epoch_vk = deriver.derive(str(i))
+        events.append(make_lineage_event(root_sk, epoch_vk, str(i), created_at=i))
+    return events
+
+
+async def ingest(events, threads, batch_size):
+    relay = LocalRelay(events, queue_size=4096)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        ingestor = LineageIngestor(executor=pool, batch_size=batch_size)
+        conn = relay.connect()
+        start = time.perf_counter()
+        await ingestor.ingest(conn, until_eose=True)
+        elapsed = time.perf_counter() - start
+        await conn.close()
+    return ingestor, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    events = build_events(args.events)
+    ingestor, elapsed = asyncio.run(ingest(events, args.threads, args.batch_size))
+    if ingestor.stats["accepted"] != args.events:
+        raise SystemExit(f"benchmark events rejected: {ingestor.stats}")
+
+    print(f"events:  {args.events}  threads: {args.threads}  batch: {args.batch_size}")
+    print(f"ingest:  {args.events / elapsed:12.0f} events/sec")
+    print(f"stats:   {ingestor.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare verify_lineage with and without a VerifiedLineageCache when the
+same lineage events are seen repeatedly (multiple relays, re-subscription).
+
+    python benchmarks/bench_verify_cache.py --events 500 --repeats 20
+"""
+import argparse
+import time
+from pathlib import Path
+import sys
+
+# Add repo root so Python can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.cache import VerifiedLineageCache
+from coldroot.core import derive_epoch_key, signing_key_from_seed_hex
+from coldroot.lineage import make_lineage_event, verify_lineage
+
+SEED_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+
+
+def build_events(count: int):
+    root_sk = signing_key_from_seed_hex(SEED_HEX)
+    events = []
+    for i in range(count):
+        _, epoch_vk = derive_epoch_key(SEED_HEX, str(i))
+        events.append(make_lineage_event(root_sk, epoch_vk, str(i), created_at=i))
+    return root_sk.verify_key.encode().hex(), events
+
+
+def run(root_hex, events, repeats, cache):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for event in events:
+            if not verify_lineage(root_hex, event, cache=cache):
+                raise SystemExit("benchmark event failed to verify")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    root_hex, events = build_events(args.events)
+    total = args.events * args.repeats
+
+    uncached = run(root_hex, events, args.repeats, None)
+    cache = VerifiedLineageCache(maxsize=args.events)
+    cached = run(root_hex, events, args.repeats, cache)
+
+    print(f"events: {args.events} x {args.repeats} repeats")
+    print(f"uncached: {total / uncached:12.0f} verifies/sec")
+    print(f"cached:   {total / cached:12.0f} verifies/sec  ({uncached / cached:.1f}x)")
+    print(f"cache:    {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
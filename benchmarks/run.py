@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the coldroot hot paths.
+
+Runs each case at several scales (number of operations) and reports
+ops/sec, per-operation latency percentiles and peak traced memory.
+Results are saved as JSON so two runs can be compared:
+
+    python benchmarks/run.py                          # scales 1,1000
+    python benchmarks/run.py --scales 1,1000,1000000  # include 1M
+    python benchmarks/run.py --compare base.json new.json --threshold 0.10
+
+bench_verify_cache.py in this directory is a focused comparison of
+verify_lineage with and without VerifiedLineageCache; bench_event_memory.py
+compares memory per tracked event for dicts and LineageEvent.
+
+verify_lineage_loop_64 and verify_lineage_batch_64 verify the same 64
+events per operation, one by one and with verify_lineage_batch, so their
+ops/sec compare directly. The batch only wins with more than one CPU.
+
+Inputs are a pool of at most POOL_SIZE distinct values, cycled to reach
+the requested scale, so large scales measure the operation and not the
+fixture generation.
+"""
+import argparse
+import datetime as _dt
+import json
+import platform
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Add repo root so Python can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.cache import VerifiedLineageCache
+from coldroot.core import (
+    derive_epoch_key,
+    hkdf_sha256,
+    nostr_bech32_encode,
+    signing_key_from_seed_hex,
+)
+from coldroot.event import LineageEvent
+from coldroot.lineage import make_lineage_event, verify_lineage, verify_lineage_batch
+
+SEED_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+POOL_SIZE = 1000
+BATCH_EVENTS = 64
+DEFAULT_SCALES = "1,1000"
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+Case = Tuple[Callable[[int], Sequence[Any]], Callable[[Any], Any]]
+
+
+def _labels(n: int) -> List[str]:
+    return [f"bench-{i}" for i in range(min(n, POOL_SIZE))]
+
+
+def _epoch_keys(n: int):
+    return [derive_epoch_key(SEED_HEX, label) + (label,) for label in _labels(n)]
+
+
+def _setup_derive(n):
+    return _labels(n)
+
+
+def _setup_hkdf(n):
+    seed = bytes.fromhex(SEED_HEX)
+    return [(seed, b"epoch:" + label.encode("utf-8")) for label in _labels(n)]
+
+
+def _setup_bech32(n):
+    return [vk.encode() for _, vk, _ in _epoch_keys(n)]
+
+
+def _setup_make(n):
+    root_sk = signing_key_from_seed_hex(SEED_HEX)
+    return [(root_sk, vk, label) for _, vk, label in _epoch_keys(n)]
+
+
+def _setup_verify(n):
+    root_sk = signing_key_from_seed_hex(SEED_HEX)
+    root_hex = root_sk.verify_key.encode().hex()
+    return [
+        (root_hex, make_lineage_event(root_sk, vk, label, created_at=0))
+        for _, vk, label in _epoch_keys(n)
+    ]
+
+
+def _setup_verify_compact(n):
+    return [(root_hex, LineageEvent.from_dict(event)) for root_hex, event in _setup_verify(n)]
+
+
+def _setup_events(n):
+    return [event for _, event in _setup_verify(n)]
+
+
+def _setup_verify_batch(n):
+    pairs = _setup_verify(BATCH_EVENTS)
+    return [(pairs[0][0], [event for _, event in pairs])]
+
+
+def _verify_loop(a):
+    return [verify_lineage(a[0], event) for event in a[1]]
+
+
+_CACHE = VerifiedLineageCache(maxsize=POOL_SIZE)
+
+CASES: Dict[str, Case] = {
+    "derive_epoch_key": (_setup_derive, lambda label: derive_epoch_key(SEED_HEX, label)),
+    "hkdf_sha256": (_setup_hkdf, lambda a: hkdf_sha256(a[0], b"nostr-cold-root", a[1], 32)),
+    "nostr_bech32_encode": (_setup_bech32, lambda pk: nostr_bech32_encode("npub", pk)),
+    "make_lineage_event": (_setup_make, lambda a: make_lineage_event(a[0], a[1], a[2], created_at=0)),
+    "verify_lineage": (_setup_verify, lambda a: verify_lineage(a[0], a[1])),
+    "verify_lineage_cached": (_setup_verify, lambda a: verify_lineage(a[0], a[1], cache=_CACHE)),
+    "lineage_event_from_dict": (_setup_events, LineageEvent.from_dict),
+    "verify_lineage_event": (_setup_verify_compact, lambda a: verify_lineage(a[0], a[1])),
+    "verify_lineage_loop_64": (_setup_verify_batch, _verify_loop),
+    "verify_lineage_batch_64": (_setup_verify_batch, lambda a: verify_lineage_batch(a[1], a[0])),
+}
+
+
+def _percentile(sorted_ns: array, q: float) -> float:
+    idx = min(len(sorted_ns) - 1, int(round(q * (len(sorted_ns) - 1))))
+    return sorted_ns[idx] / 1000.0
+
+
+def run_case(name: str, scale: int, memory: bool = True) -> Dict[str, Any]:
+    setup, op = CASES[name]
+    pool = setup(scale)
+    size = len(pool)
+    clock = time.perf_counter_ns
+
+    latencies = array("Q", bytes(8 * scale))
+    start = clock()
+    for i in range(scale):
+        t0 = clock()
+        op(pool[i % size])
+        latencies[i] = clock() - t0
+    elapsed = (clock() - start) / 1e9
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        for i in range(scale):
+            op(pool[i % size])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    ordered = array("Q", sorted(latencies))
+    return {
+        "name": name,
+        "scale": scale,
+        "ops_per_sec": scale / elapsed if elapsed else float("inf"),
+        "p50_us": _percentile(ordered, 0.50),
+        "p95_us": _percentile(ordered, 0.95),
+        "p99_us": _percentile(ordered, 0.99),
+        "max_us": ordered[-1] / 1000.0,
+        "peak_mem_kib": None if peak is None else peak / 1024.0,
+    }
+
+
+def run_suite(names: List[str], scales: List[int], memory: bool = True) -> Dict[str, Any]:
+    results = []
+    for name in names:
+        for scale in scales:
+            result = run_case(name, scale, memory)
+            print(_format(result), flush=True)
+            results.append(result)
+    return {
+        "meta": {
+            "timestamp": _dt.datetime.now(_dt.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def _format(r: Dict[str, Any]) -> str:
+    mem = "-" if r["peak_mem_kib"] is None else f"{r['peak_mem_kib']:.1f}KiB"
+    return (
+        f"{r['name']:<24} n={r['scale']:<8} {r['ops_per_sec']:>12.0f} ops/s  "
+        f"p50={r['p50_us']:.1f}us p95={r['p95_us']:.1f}us p99={r['p99_us']:.1f}us  peak={mem}"
+    )
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float, min_scale: int = 1000) -> List[str]:
+    """
+    Return one line per (case, scale) whose ops/sec dropped by more than
+    threshold (a fraction) between base and new. Scales below min_scale are
+    printed but never flagged; single-op timings are too noisy to gate on.
+    """
+    before = {(r["name"], r["scale"]): r for r in base["results"]}
+    regressions = []
+    for r in new["results"]:
+        old = before.get((r["name"], r["scale"]))
+        if old is None:
+            continue
+        change = r["ops_per_sec"] / old["ops_per_sec"] - 1.0
+        line = f"{r['name']:<24} n={r['scale']:<8} {old['ops_per_sec']:>12.0f} -> {r['ops_per_sec']:>12.0f} ops/s ({change:+.1%})"
+        print(line)
+        if change < -threshold and r["scale"] >= min_scale:
+            regressions.append(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="coldroot hot path benchmarks")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma separated case names")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="comma separated op counts, e.g. 1,1000,1000000")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory pass")
+    parser.add_argument("--out", help="result JSON path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two result files and exit")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed ops/sec drop for --compare (default 0.10)")
+    parser.add_argument("--min-scale", type=int, default=1000, help="smallest scale --compare may flag (default 1000)")
+    args = parser.parse_args()
+
+    if args.compare:
+        base, new = (json.loads(Path(p).read_text()) for p in args.compare)
+        regressions = compare(base, new, args.threshold, args.min_scale)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    names = [n for n in args.cases.split(",") if n]
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        raise SystemExit(f"unknown case(s): {', '.join(unknown)}")
+    scales = [int(s) for s in args.scales.split(",") if s]
+
+    data = run_suite(names, scales, memory=not args.no_memory)
+
+    if args.out:
+        out = Path(args.out)
+    else:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        out = RESULTS_DIR / (time.strftime("%Y%m%d-%H%M%S") + ".json")
+    out.write_text(json.dumps(data, indent=2) + "\n")
+    print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main()
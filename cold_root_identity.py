@@ -17,6 +17,7 @@ Non hardened, non production ready. Test code only.
 
 import argparse
 import json
+import os
 import sys
 from typing import Any, Dict
 
@@ -30,6 +31,8 @@ from coldroot import (
     make_lineage_event,
     verify_lineage,
 )
+from coldroot.bundle import expand_label_range, iter_lineage_bundle, write_lineage_bundle
+from coldroot.cache import get_root_verify_key
 
 
 def cmd_init(args: argparse.Namespace) -> None:
@@ -82,6 +85,43 @@ def cmd_derive_epoch(args: argparse.Namespace) -> None:
     print(json.dumps(event, indent=2))
 
 
+def cmd_derive_bundle(args: argparse.Namespace) -> None:
+    root_seed_hex = args.root_seed_hex.lower()
+
+    if args.labels:
+        labels = [l for l in args.labels.split(",") if l]
+    else:
+        labels = expand_label_range(args.range)
+
+    root_vk = signing_key_from_seed_hex(root_seed_hex).verify_key
+    events = iter_lineage_bundle(
+        root_seed_hex,
+        labels,
+        kind=args.kind,
+        created_at_base=args.created_at_base,
+    )
+
+    # Write to a temp file first so a failed ceremony never leaves a
+    # partial bundle behind.
+    tmp_path = args.out + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            count = write_lineage_bundle(f, events)
+        os.replace(tmp_path, args.out)
+    except ValueError as exc:
+        print(f"Bundle aborted: {exc}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        # still there unless the replace succeeded (also on OSError or Ctrl-C)
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    print("=== Lineage Bundle ===")
+    print(f"Root pubkey: {root_vk.encode().hex()}")
+    print(f"Events: {count}")
+    print(f"Written to: {args.out}")
+
+
 def cmd_verify_lineage(args: argparse.Namespace) -> None:
     with open(args.event_file, "r", encoding="utf-8") as f:
         event = json.load(f)
@@ -101,6 +141,14 @@ def cmd_verify_lineage(args: argparse.Namespace) -> None:
         print("Could not determine root pubkey (no --root-pubkey-hex and no root tag).", file=sys.stderr)
         sys.exit(1)
 
+    # Parse the root once through the shared registry; verify_lineage
+    # reuses the same VerifyKey instead of decoding it again.
+    try:
+        get_root_verify_key(root_to_use)
+    except ValueError as exc:
+        print(f"Invalid root pubkey: {exc}", file=sys.stderr)
+        sys.exit(1)
+
     if verify_lineage(root_to_use, event):
         print("VALID lineage event.")
         print(f"Root pubkey:  {root_to_use}")
@@ -143,6 +191,43 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_der.set_defaults(func=cmd_derive_epoch)
 
+    # derive-bundle
+    p_bun = sub.add_parser(
+        "derive-bundle",
+        help="derive and sign lineage events for many epochs into one NDJSON bundle",
+    )
+    p_bun.add_argument(
+        "--root-seed-hex",
+        required=True,
+        help="32-byte root seed in hex (64 chars). RUN OFFLINE.",
+    )
+    labels = p_bun.add_mutually_exclusive_group(required=True)
+    labels.add_argument(
+        "--labels",
+        help="comma separated epoch labels, e.g. 2026-Q1,2026-Q2",
+    )
+    labels.add_argument(
+        "--range",
+        help="inclusive label range, e.g. 2026-Q1..2030-Q4 or 0..999",
+    )
+    p_bun.add_argument(
+        "--out",
+        required=True,
+        help="path of the NDJSON bundle to write (lineage events only, no secrets)",
+    )
+    p_bun.add_argument(
+        "--kind",
+        type=int,
+        default=30001,
+        help="event kind to use for lineage (default: 30001)",
+    )
+    p_bun.add_argument(
+        "--created-at-base",
+        type=int,
+        help="created_at of the first event, +1 per label; default maps YYYY-Qn labels to the quarter start",
+    )
+    p_bun.set_defaults(func=cmd_derive_bundle)
+
     # verify-lineage
     p_ver = sub.add_parser(
         "verify-lineage",
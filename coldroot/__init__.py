@@ -1,25 +1,66 @@
 # coldroot/__init__.py
 
-from .core import (
-    generate_root_seed,
-    root_seed_to_hex,
-    signing_key_from_seed_hex,
-    derive_epoch_key,
-    npub_from_verify_key,
-    nsec_from_signing_key,
-)
-from .lineage import (
-    make_lineage_event,
-    verify_lineage,
-)
-
-__all__ = [
-    "generate_root_seed",
-    "root_seed_to_hex",
-    "signing_key_from_seed_hex",
-    "derive_epoch_key",
-    "npub_from_verify_key",
-    "nsec_from_signing_key",
-    "make_lineage_event",
-    "verify_lineage",
-]
+"""
+Cold Root Identity reference implementation.
+
+Public names are resolved lazily (PEP 562): `import coldroot` is cheap and
+each submodule, and PyNaCl, is only imported when one of its names is
+first used. `from coldroot import verify_lineage` works as before.
+"""
+
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    "generate_root_seed": "core",
+    "root_seed_to_hex": "core",
+    "signing_key_from_seed_hex": "core",
+    "derive_epoch_key": "core",
+    "npub_from_verify_key": "core",
+    "nsec_from_signing_key": "core",
+    "RootDeriver": "core",
+    "make_lineage_event": "lineage",
+    "verify_lineage": "lineage",
+    "verify_lineage_batch": "lineage",
+    "check_lineage": "lineage",
+    "prevalidate_lineage": "lineage",
+    "Rejection": "lineage",
+    "LineageEvent": "event",
+    "event_id": "nip01",
+    "sign_event": "nip01",
+    "verify_event": "nip01",
+    "VerifiedLineageCache": "cache",
+    "NegativeLineageCache": "cache",
+    "LineageChain": "chain",
+    "LineageIndex": "chain",
+    "resolve_current_epochs": "chain",
+    "verify_lineage_parallel": "parallel",
+    "ShardedResolver": "shard",
+    "averify_lineage": "aio",
+    "averify_lineage_many": "aio",
+    "aderive_epoch_key": "aio",
+    "EpochRootIndex": "reverse",
+    "LineageIngestor": "relay",
+    "LocalRelay": "relay",
+    "LineageStore": "store",
+    "LineageArchive": "archive",
+    "write_archive": "archive",
+    "decode_npub": "bech32",
+    "decode_nsec": "bech32",
+    "npubs_from_pubkeys": "bech32",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,192 @@
+# coldroot/aio.py
+
+"""
+Asyncio front end for the CPU-bound coldroot calls.
+
+Key derivation and signature checks run on one shared executor, a thread
+pool by default (PyNaCl releases the GIL, so threads verify in parallel),
+or any executor passed to configure(), including a ProcessPoolExecutor.
+A per-event-loop semaphore caps the number of jobs in flight, so a burst
+of requests queues on the loop instead of flooding the pool.
+
+Cancelling a call while it waits for the semaphore or for a pool slot
+withdraws the job; a job already running finishes in its worker and its
+result is discarded.
+
+Cache lookups (VerifiedLineageCache, NegativeLineageCache) happen on the
+event loop thread, never in the pool, so the caches need no locking and
+hits never leave the loop.
+"""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from nacl import signing
+
+from .cache import NegativeLineageCache, VerifiedLineageCache
+from .core import derive_epoch_key
+from .event import LineageEvent
+from .lineage import (
+    Rejection,
+    _check_event_fields,
+    _expected_roots,
+    _lineage_fields,
+    check_lineage,
+    verify_lineage_batch,
+)
+
+DEFAULT_CHUNKSIZE = 256
+
+_executor: Optional[Executor] = None
+_owns_executor = False
+_max_concurrency: Optional[int] = None
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def configure(executor: Optional[Executor] = None, max_concurrency: Optional[int] = None) -> None:
+    """
+    Set the shared executor and the number of jobs allowed in flight per
+    event loop. Passing None restores the default for that setting: a
+    ThreadPoolExecutor with one thread per CPU, and twice its size in
+    flight. An executor passed in is never shut down by this module.
+    """
+    global _executor, _owns_executor, _max_concurrency
+    if max_concurrency is not None and max_concurrency <= 0:
+        raise ValueError("max_concurrency must be positive")
+    shutdown()
+    _executor = executor
+    _owns_executor = False
+    _max_concurrency = max_concurrency
+
+
+def shutdown() -> None:
+    """
+    Shut down the default thread pool, if one was started.
+    """
+    global _executor, _owns_executor
+    if _owns_executor and _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    _owns_executor = False
+    _semaphores.clear()
+
+
+def get_executor() -> Executor:
+    global _executor, _owns_executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="coldroot")
+        _owns_executor = True
+    return _executor
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        limit = _max_concurrency
+        if limit is None:
+            limit = 2 * (getattr(get_executor(), "_max_workers", None) or os.cpu_count() or 1)
+        sem = _semaphores[loop] = asyncio.Semaphore(limit)
+    return sem
+
+
+async def _run(func, *args):
+    async with _semaphore():
+        return await asyncio.get_running_loop().run_in_executor(get_executor(), func, *args)
+
+
+async def aderive_epoch_key(root_seed_hex: str, epoch_label: str) -> Tuple[signing.SigningKey, signing.VerifyKey]:
+    """
+    derive_epoch_key on the shared executor.
+    """
+    return await _run(derive_epoch_key, root_seed_hex, epoch_label)
+
+
+def _fingerprint(root_pubkey_hex: str, event) -> Union[Rejection, Tuple[str, str, str]]:
+    """
+    Structural checks on the loop, then the cache key for the event.
+    """
+    if root_pubkey_hex is None:
+        return Rejection.ROOT_MISMATCH
+    if type(event) is LineageEvent:
+        reason = _check_event_fields(root_pubkey_hex, event)
+        if reason is not None:
+            return reason
+        return event.root.hex(), event.pubkey.hex(), event.sig.hex()
+    fields = _lineage_fields(root_pubkey_hex, event)
+    if type(fields) is Rejection:
+        return fields
+    return VerifiedLineageCache.key(fields[0], fields[1], fields[2])
+
+
+async def acheck_lineage(
+    root_pubkey_hex: str,
+    event: Dict,
+    cache: Optional[VerifiedLineageCache] = None,
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> Optional[Rejection]:
+    """
+    check_lineage with the signature check on the shared executor.
+    Malformed events and cache hits are answered without leaving the loop.
+    """
+    key = _fingerprint(root_pubkey_hex, event)
+    if type(key) is Rejection:
+        return key
+    if negative_cache is not None and negative_cache.contains(key, source):
+        return Rejection.BAD_SIGNATURE
+    if cache is not None and cache.contains(key):
+        return None
+
+    reason = await _run(check_lineage, root_pubkey_hex, event)
+    if reason is None:
+        if cache is not None:
+            cache.add(key)
+    elif reason is Rejection.BAD_SIGNATURE and negative_cache is not None:
+        negative_cache.add(key, source)
+    return reason
+
+
+async def averify_lineage(
+    root_pubkey_hex: str,
+    event: Dict,
+    cache: Optional[VerifiedLineageCache] = None,
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> bool:
+    """
+    verify_lineage without blocking the event loop.
+    """
+    reason = await acheck_lineage(root_pubkey_hex, event, cache, negative_cache, source)
+    return reason is None
+
+
+async def averify_lineage_many(
+    events: Iterable[Dict],
+    expected_roots: Optional[Union[str, Sequence[Optional[str]]]] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> List[bool]:
+    """
+    verify_lineage_batch over many events, split into chunks that run
+    concurrently on the shared executor (within the concurrency limit).
+    expected_roots is as for verify_lineage_batch. Cancelling the call
+    cancels every chunk that has not started.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    events = list(events)
+    expected = list(_expected_roots(events, expected_roots))
+    chunks = [
+        # jobs=1: the chunks are already spread over the shared executor
+        _run(verify_lineage_batch, events[i:i + chunksize], expected[i:i + chunksize], 1)
+        for i in range(0, len(events), chunksize)
+    ]
+    results: List[bool] = []
+    for chunk in await asyncio.gather(*chunks):
+        results.extend(chunk)
+    return results
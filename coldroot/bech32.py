@@ -0,0 +1,161 @@
+# coldroot/bech32.py
+
+"""
+Table-driven bech32 codec for npub / nsec (NIP-19).
+
+Produces exactly the same strings as the list-based reference encoder in
+coldroot.core, but works on bytes: the polymod uses a precomputed
+32-entry table, the checksum state after each HRP is cached, and 8 <-> 5
+bit conversion goes through a single Python int.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Union
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+_GENERATOR = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+
+
+def _build_table() -> Tuple[int, ...]:
+    table = []
+    for top in range(32):
+        value = 0
+        for i in range(5):
+            if (top >> i) & 1:
+                value ^= _GENERATOR[i]
+        table.append(value)
+    return tuple(table)
+
+
+_POLYMOD_TABLE = _build_table()
+
+# byte value (0..31) -> charset character, for bytes.translate
+_ENCODE_TABLE = bytes(CHARSET.encode("ascii")) + bytes(256 - 32)
+
+_DECODE_MAP = {c: i for i, c in enumerate(CHARSET)}
+
+
+def polymod(values: Iterable[int], chk: int = 1) -> int:
+    table = _POLYMOD_TABLE
+    for v in values:
+        chk = ((chk & 0x1ffffff) << 5) ^ v ^ table[chk >> 25]
+    return chk
+
+
+@lru_cache(maxsize=16)
+def _hrp_state(hrp: str) -> int:
+    """
+    Polymod state after the expanded HRP, cached per HRP.
+    """
+    expanded = [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
+    return polymod(expanded)
+
+
+def to_five_bit(data: bytes) -> bytes:
+    """
+    Regroup bytes into 5 bit symbols, zero padding the last one.
+    """
+    nbits = len(data) * 8
+    groups = (nbits + 4) // 5
+    acc = int.from_bytes(data, "big") << (groups * 5 - nbits)
+    return bytes((acc >> (5 * i)) & 31 for i in range(groups - 1, -1, -1))
+
+
+def from_five_bit(data: bytes) -> bytes:
+    """
+    Regroup 5 bit symbols into bytes. Raises ValueError on invalid padding.
+    """
+    nbits = len(data) * 5
+    nbytes = nbits // 8
+    pad = nbits - nbytes * 8
+    if pad >= 5:
+        raise ValueError("invalid bech32 padding")
+    acc = 0
+    for v in data:
+        acc = (acc << 5) | v
+    if acc & ((1 << pad) - 1):
+        raise ValueError("non-zero bech32 padding")
+    return (acc >> pad).to_bytes(nbytes, "big")
+
+
+def encode(hrp: str, data: bytes) -> str:
+    """
+    bech32 encode raw bytes under an HRP, e.g. encode("npub", pubkey).
+    """
+    five = to_five_bit(data)
+    chk = polymod(five, _hrp_state(hrp))
+    chk = polymod(b"\x00\x00\x00\x00\x00\x00", chk) ^ 1
+    checksum = bytes((chk >> 5 * (5 - i)) & 31 for i in range(6))
+    return hrp + "1" + (five + checksum).translate(_ENCODE_TABLE).decode("ascii")
+
+
+def decode(bech: str) -> Tuple[str, bytes]:
+    """
+    Decode a bech32 string into (hrp, raw bytes).
+
+    Raises ValueError on mixed case, bad characters, a bad checksum or
+    invalid padding.
+    """
+    if bech.lower() != bech and bech.upper() != bech:
+        raise ValueError("mixed case bech32 string")
+    bech = bech.lower()
+    pos = bech.rfind("1")
+    if pos < 1 or pos + 7 > len(bech):
+        raise ValueError("invalid bech32 separator position")
+
+    hrp = bech[:pos]
+    if any(ord(c) < 33 or ord(c) > 126 for c in hrp):
+        raise ValueError("invalid bech32 hrp")
+    try:
+        values = bytes(_DECODE_MAP[c] for c in bech[pos + 1:])
+    except KeyError:
+        raise ValueError("invalid bech32 character") from None
+
+    if polymod(values, _hrp_state(hrp)) != 1:
+        raise ValueError("invalid bech32 checksum")
+    return hrp, from_five_bit(values[:-6])
+
+
+def _decode_key(hrp: str, bech: str) -> bytes:
+    got_hrp, data = decode(bech)
+    if got_hrp != hrp:
+        raise ValueError(f"expected {hrp} string, got {got_hrp}")
+    if len(data) != 32:
+        raise ValueError(f"{hrp} must encode 32 bytes")
+    return data
+
+
+def decode_npub(npub: str) -> bytes:
+    """
+    Return the 32 byte pubkey encoded in an npub string.
+    """
+    return _decode_key("npub", npub)
+
+
+def decode_nsec(nsec: str) -> bytes:
+    """
+    Return the 32 byte seed encoded in an nsec string.
+    """
+    return _decode_key("nsec", nsec)
+
+
+def npubs_from_pubkeys(pubkeys: Iterable[Union[bytes, str]]) -> List[str]:
+    """
+    Encode many pubkeys (32 raw bytes or 64 hex chars each) as npub strings.
+    """
+    out = []
+    for pk in pubkeys:
+        if isinstance(pk, str):
+            pk = bytes.fromhex(pk)
+        if len(pk) != 32:
+            raise ValueError("pubkey must be 32 bytes")
+        out.append(encode("npub", pk))
+    return out
+
+
+def pubkeys_from_npubs(npubs: Iterable[str]) -> List[bytes]:
+    """
+    Decode many npub strings into 32 byte pubkeys.
+    """
+    return [decode_npub(n) for n in npubs]
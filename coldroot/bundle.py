@@ -0,0 +1,97 @@
+# coldroot/bundle.py
+
+import json
+from typing import IO, Dict, Iterable, Iterator, Optional
+
+from .core import RootDeriver, signing_key_from_seed_hex
+from .lineage import make_lineage_event
+from .reference_api import _deterministic_created_at
+
+
+def _parse_quarter(label: str):
+    year_str, quarter_str = label.split("-Q")
+    year, quarter = int(year_str), int(quarter_str)
+    if quarter not in (1, 2, 3, 4):
+        raise ValueError(f"Invalid quarter in label: {label!r}")
+    return year, quarter
+
+
+def expand_label_range(spec: str) -> Iterator[str]:
+    """
+    Expand an inclusive label range.
+
+    Supported forms:
+    - "2026-Q1..2027-Q4": quarter labels, matching the reference vectors
+    - "0..99": sequential integer labels
+    """
+    try:
+        start, stop = spec.split("..")
+    except ValueError:
+        raise ValueError(f"Invalid label range: {spec!r}") from None
+
+    if start.isdigit() and stop.isdigit():
+        for i in range(int(start), int(stop) + 1):
+            yield str(i)
+        return
+
+    try:
+        year, quarter = _parse_quarter(start)
+        stop_year, stop_quarter = _parse_quarter(stop)
+    except ValueError:
+        raise ValueError(f"Invalid label range: {spec!r}") from None
+
+    while (year, quarter) <= (stop_year, stop_quarter):
+        yield f"{year}-Q{quarter}"
+        year, quarter = (year + 1, 1) if quarter == 4 else (year, quarter + 1)
+
+
+def iter_lineage_bundle(
+    root_seed_hex: str,
+    labels: Iterable[str],
+    kind: int = 30001,
+    created_at_base: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Derive and sign one lineage event per label, lazily.
+
+    The root SigningKey and HKDF state are built once and shared by every
+    label. created_at is deterministic: the first second of the quarter for
+    "YYYY-Qn" labels (as in the reference vectors), or created_at_base + i
+    for the i-th label when a base is given.
+
+    Raises ValueError if a label repeats, since SPEC.md forbids label reuse
+    for the same root.
+    """
+    root_sk = signing_key_from_seed_hex(root_seed_hex)
+    deriver = RootDeriver.from_hex(root_seed_hex)
+    seen = set()
+
+    for i, label in enumerate(labels):
+        if label in seen:
+            raise ValueError(f"epoch label repeats in bundle: {label!r}")
+        seen.add(label)
+
+        if created_at_base is None:
+            created_at = _deterministic_created_at(label)
+        else:
+            created_at = created_at_base + i
+
+        _, epoch_vk = deriver.derive(label)
+        yield make_lineage_event(
+            root_sk=root_sk,
+            epoch_vk=epoch_vk,
+            epoch_label=label,
+            kind=kind,
+            created_at=created_at,
+        )
+
+
+def write_lineage_bundle(fp: IO[str], events: Iterable[Dict]) -> int:
+    """
+    Write events as NDJSON, one compact event per line. Returns the count.
+    """
+    count = 0
+    for event in events:
+        fp.write(json.dumps(event, separators=(",", ":")) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,241 @@
+# coldroot/cache.py
+
+import binascii
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from nacl import signing
+
+CacheKey = Tuple[str, str, str]
+
+
+class VerifiedLineageCache:
+    """
+    Bounded LRU cache of lineage signatures that already verified.
+
+    Keys are (root_pubkey_hex, epoch_pubkey_hex, sig_hex), lowercased so
+    they identify the same bytes as the decoded values. Only successful
+    verifications are stored; a miss always falls through to the crypto.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(root_hex: str, pubkey_hex: str, sig_hex: str) -> CacheKey:
+        return root_hex.lower(), pubkey_hex.lower(), sig_hex.lower()
+
+    def contains(self, key: CacheKey) -> bool:
+        """
+        Return True if key verified before, counting a hit or a miss.
+        """
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, key: CacheKey) -> None:
+        """
+        Record a successful verification, evicting the least recently used
+        entry once the cache is full.
+        """
+        entries = self._entries
+        entries[key] = None
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def invalidate(self, root_pubkey_hex: Optional[str] = None) -> int:
+        """
+        Drop cached entries for one root, or everything if root is None.
+        Returns the number of entries removed.
+        """
+        if root_pubkey_hex is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        root = root_pubkey_hex.lower()
+        stale = [k for k in self._entries if k[0] == root]
+        for k in stale:
+            del self._entries[k]
+        return len(stale)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class NegativeLineageCache:
+    """
+    Bounded, expiring cache of lineage signatures that failed to verify,
+    so a forged event re-broadcast across relays is dropped in O(1).
+
+    Keys are the same (root, pubkey, sig) fingerprints as
+    VerifiedLineageCache, but the two caches are separate objects and are
+    never consulted for each other's answer: a hit here can only reject.
+    Entries expire ttl seconds after they were last recorded; the oldest
+    entry is evicted once the cache is full.
+
+    Per-source counters ("rejected": fresh failures recorded, "dropped":
+    copies answered from the cache) are kept for up to max_sources sources
+    such as relay URLs; further sources are counted under "other".
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 65536,
+        ttl: float = 600.0,
+        max_sources: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_sources = max_sources
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.sources: Dict[str, Dict[str, int]] = {}
+        # key -> expiry time, oldest first (every entry has the same ttl)
+        self._entries: "OrderedDict[CacheKey, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    key = staticmethod(VerifiedLineageCache.key)
+
+    def _count(self, source: Optional[str], field: str) -> None:
+        if source is None:
+            return
+        counters = self.sources.get(source)
+        if counters is None:
+            if len(self.sources) >= self.max_sources:
+                source = "other"
+            counters = self.sources.setdefault(source, {"rejected": 0, "dropped": 0})
+        counters[field] += 1
+
+    def contains(self, key: CacheKey, source: Optional[str] = None) -> bool:
+        """
+        Return True if key failed verification within the last ttl seconds.
+        """
+        expiry = self._entries.get(key)
+        if expiry is None:
+            self.misses += 1
+            return False
+        if expiry <= self.clock():
+            del self._entries[key]
+            self.misses += 1
+            return False
+        self.hits += 1
+        self._count(source, "dropped")
+        return True
+
+    def add(self, key: CacheKey, source: Optional[str] = None) -> None:
+        """
+        Record a failed signature check, expiring stale entries from the
+        old end and evicting the oldest entry once the cache is full.
+        """
+        entries = self._entries
+        now = self.clock()
+        entries[key] = now + self.ttl
+        entries.move_to_end(key)
+        while entries:
+            oldest, expiry = next(iter(entries.items()))
+            if expiry > now and len(entries) <= self.maxsize:
+                break
+            del entries[oldest]
+        self._count(source, "rejected")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sources": {k: dict(v) for k, v in self.sources.items()},
+        }
+
+
+class RootKeyCache:
+    """
+    Bounded LRU registry of parsed root VerifyKey objects, keyed by the
+    lowercased root pubkey hex, so a popular root is decoded and built once.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[str, signing.VerifyKey]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, root_pubkey_hex: str) -> signing.VerifyKey:
+        """
+        Return the VerifyKey for a root pubkey hex string.
+
+        Raises ValueError if the hex is malformed or not 32 bytes.
+        """
+        keys = self._keys
+        try:
+            vk = keys[root_pubkey_hex]
+        except KeyError:
+            pass
+        else:
+            keys.move_to_end(root_pubkey_hex)
+            return vk
+
+        name = root_pubkey_hex.lower()
+        vk = keys.get(name)
+        if vk is None:
+            try:
+                raw = binascii.unhexlify(name)
+            except (binascii.Error, ValueError):
+                raise ValueError("root pubkey must be hex") from None
+            if len(raw) != 32:
+                raise ValueError("root pubkey must be 32 bytes (64 hex chars)")
+            vk = signing.VerifyKey(raw)
+            keys[name] = vk
+        keys.move_to_end(name)
+        if len(keys) > self.maxsize:
+            keys.popitem(last=False)
+        return vk
+
+    def evict(self, root_pubkey_hex: str) -> bool:
+        return self._keys.pop(root_pubkey_hex.lower(), None) is not None
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+# Process-wide registry shared by coldroot.lineage and the CLIs.
+root_keys = RootKeyCache()
+
+
+def get_root_verify_key(root_pubkey_hex: str) -> signing.VerifyKey:
+    return root_keys.get(root_pubkey_hex)
@@ -0,0 +1,193 @@
+# coldroot/chain.py
+
+import bisect
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .cache import VerifiedLineageCache
+from .lineage import _extract_lineage_tags, verify_lineage
+
+SortKey = Tuple[int, str]
+
+
+class LineageChain:
+    """
+    Accepted lineage events for a single root authority.
+
+    Events are kept sorted by (created_at, epoch pubkey hex); the pubkey is
+    the deterministic tie breaker allowed by SPEC.md section 6.2, so the
+    active epoch does not depend on arrival order. Seen epoch pubkeys and
+    labels are hash sets, so the reuse checks of sections 4.2 and 4.3 are O(1).
+    """
+
+    __slots__ = ("root", "_keys", "_events", "_pubkeys", "_labels")
+
+    def __init__(self, root_pubkey_hex: str):
+        self.root = root_pubkey_hex.lower()
+        self._keys: List[SortKey] = []
+        self._events: List[Dict] = []
+        self._pubkeys: Set[str] = set()
+        self._labels: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Iterate accepted events, oldest first.
+        """
+        return iter(self._events)
+
+    def has_pubkey(self, pubkey_hex: str) -> bool:
+        return pubkey_hex.lower() in self._pubkeys
+
+    def has_label(self, label: str) -> bool:
+        return label in self._labels
+
+    def add(self, event: Dict, pubkey_hex: str, label: str) -> bool:
+        """
+        Insert an already verified event. Returns False if its epoch pubkey
+        or label was seen before for this root.
+        """
+        pubkey_hex = pubkey_hex.lower()
+        if pubkey_hex in self._pubkeys or label in self._labels:
+            return False
+
+        key = (event["created_at"], pubkey_hex)
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._events.insert(i, event)
+        self._pubkeys.add(pubkey_hex)
+        self._labels.add(label)
+        return True
+
+    def current(self) -> Optional[Dict]:
+        """
+        Return the newest accepted event (the active epoch), or None.
+        """
+        return self._events[-1] if self._events else None
+
+
+class LineageIndex:
+    """
+    Incremental index of lineage events across many roots.
+
+    Events are fed one at a time with add(). Each is checked for reuse of an
+    epoch pubkey or label within its root (cheap) before the signature is
+    verified (expensive), so re-delivered and replayed events never reach
+    the crypto.
+    """
+
+    def __init__(self, cache: Optional[VerifiedLineageCache] = None):
+        self.cache = cache
+        self._chains: Dict[str, LineageChain] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """
+        Number of accepted events across all roots.
+        """
+        return self._count
+
+    def __contains__(self, root_pubkey_hex: str) -> bool:
+        return root_pubkey_hex.lower() in self._chains
+
+    def roots(self) -> Iterator[str]:
+        return iter(self._chains)
+
+    def chain(self, root_pubkey_hex: str) -> Optional[LineageChain]:
+        return self._chains.get(root_pubkey_hex.lower())
+
+    def add(self, event: Dict, verify: bool = True) -> bool:
+        """
+        Add a lineage event to the chain of the root named in its root tag.
+
+        Returns True if the event was accepted. Events are rejected if they
+        are malformed, reuse an epoch pubkey or label already seen for their
+        root, or (when verify is True) fail verify_lineage. Pass
+        verify=False only for events that were verified earlier.
+        """
+        if not isinstance(event, dict):
+            return False
+        pubkey_hex = event.get("pubkey")
+        created_at = event.get("created_at")
+        if not isinstance(pubkey_hex, str) or type(created_at) is not int:
+            return False
+
+        root_hex, _, label = _extract_lineage_tags(event)
+        if not isinstance(root_hex, str) or not isinstance(label, str):
+            return False
+
+        root = root_hex.lower()
+        chain = self._chains.get(root)
+        if chain is not None and (chain.has_pubkey(pubkey_hex) or chain.has_label(label)):
+            return False
+
+        if verify and not verify_lineage(root, event, cache=self.cache):
+            return False
+
+        if chain is None:
+            chain = self._chains[root] = LineageChain(root)
+        chain.add(event, pubkey_hex, label)
+        self._count += 1
+        return True
+
+    def pop(self, root_pubkey_hex: str) -> Optional[LineageChain]:
+        """
+        Remove and return the chain for a root, or None if there is none.
+        """
+        chain = self._chains.pop(root_pubkey_hex.lower(), None)
+        if chain is not None:
+            self._count -= len(chain)
+        return chain
+
+    def current_epoch(self, root_pubkey_hex: str) -> Optional[Dict]:
+        """
+        Return the active lineage event for a root (SPEC.md section 5), or None.
+        """
+        chain = self._chains.get(root_pubkey_hex.lower())
+        return chain.current() if chain is not None else None
+
+
+def resolve_current_epochs(
+    roots: Iterable[str],
+    events: Iterable[Dict],
+    cache: Optional[VerifiedLineageCache] = None,
+) -> Dict[str, Tuple[str, str, int]]:
+    """
+    Resolve root -> currently authorized epoch for many roots in one pass.
+
+    events may be any iterable (e.g. a relay stream); events for roots not
+    in roots are skipped without verification. Each distinct event is
+    verified at most once: re-delivered valid events are caught by the
+    chain's reuse checks and repeated invalid ones by their
+    (root, pubkey, sig) fingerprint, so cost is linear in the number of
+    events.
+
+    Returns {root: (epoch_pubkey_hex, label, created_at)} keyed by the root
+    strings as given; roots without valid lineage are absent.
+    """
+    wanted = {r.lower(): r for r in roots}
+    index = LineageIndex(cache=cache)
+    rejected: Set[Tuple[str, str, str]] = set()
+
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        root_hex, sig_hex, _ = _extract_lineage_tags(event)
+        if not isinstance(root_hex, str) or root_hex.lower() not in wanted:
+            continue
+        fingerprint = (root_hex.lower(), str(event.get("pubkey")).lower(), str(sig_hex).lower())
+        if fingerprint in rejected:
+            continue
+        if not index.add(event):
+            chain = index.chain(root_hex)
+            if chain is None or not chain.has_pubkey(fingerprint[1]):
+                rejected.add(fingerprint)
+
+    resolved = {}
+    for root, original in wanted.items():
+        current = index.current_epoch(root)
+        if current is not None:
+            _, _, label = _extract_lineage_tags(current)
+            resolved[original] = (current["pubkey"], label, current["created_at"])
+    return resolved
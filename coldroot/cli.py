@@ -1,17 +1,20 @@
 #!/usr/bin/env python3
 import argparse
+import itertools
 import json
 import sys
 from pathlib import Path
 
-from .core import derive_epoch_key, signing_key_from_seed_hex, root_seed_to_hex
-from .lineage import make_lineage_event, verify_lineage
+# Subcommands import what they need themselves so that `coldroot --help`
+# and light commands never pay for PyNaCl or unrelated modules at startup.
 
 
 def cmd_derive(args):
     """
     coldroot derive --epoch 2026Q1 --root-seed <hex>
     """
+    from .core import derive_epoch_key
+
     label = args.epoch
     root_seed_hex = args.root_seed
 
@@ -29,6 +32,9 @@ def cmd_lineage(args):
     """
     coldroot lineage --epoch 2026Q1 --root-seed <hex>
     """
+    from .core import derive_epoch_key, signing_key_from_seed_hex
+    from .lineage import make_lineage_event
+
     label = args.epoch
     root_seed_hex = args.root_seed
 
@@ -52,7 +58,16 @@ def cmd_lineage(args):
 def cmd_verify(args):
     """
     coldroot verify lineage.json
+    coldroot verify --stream [events.ndjson]
     """
+    if args.stream:
+        cmd_verify_stream(args)
+        return
+
+    if args.file is None:
+        print("error: a lineage.json path is required without --stream", file=sys.stderr)
+        sys.exit(1)
+
     path = Path(args.file)
     if not path.exists():
         print(f"error: file not found: {path}", file=sys.stderr)
@@ -61,6 +76,8 @@ def cmd_verify(args):
     with path.open() as f:
         event = json.load(f)
 
+    from .lineage import verify_lineage
+
     root_hex, _, _ = extract_root_tag(event)
     if root_hex is None:
         print("error: lineage event missing root tag", file=sys.stderr)
@@ -74,14 +91,162 @@ def cmd_verify(args):
         sys.exit(1)
 
 
+def _stream_results(lines, cache, pool=None, chunksize=None):
+    """
+    Verify a block of NDJSON lines and return their result records in order.
+    With a pool, signatures are checked by verify_lineage_parallel workers.
+    Every line is recorded as one check on the active metrics, whichever
+    stage rejected it; pool checks share the block's verify time evenly.
+    """
+    from . import metrics as _metrics
+    from .lineage import Rejection, _extract_lineage_tags, check_lineage, prevalidate_lineage
+
+    results = []
+    pending = []
+    m = _metrics.ACTIVE
+    for line in lines:
+        if m is not None:
+            t = _metrics.clock()
+        try:
+            event = json.loads(line)
+        except ValueError:
+            event = None
+        if m is not None:
+            m.observe("parse", _metrics.clock() - t)
+            t = _metrics.clock()
+        if not isinstance(event, dict):
+            results.append({"id": None, "pubkey": None, "valid": False, "reason": Rejection.INVALID_JSON})
+            if m is not None:
+                m.record_check(Rejection.INVALID_JSON, _metrics.clock() - t)
+            continue
+
+        result = {"id": event.get("id"), "pubkey": event.get("pubkey"), "valid": False}
+        results.append(result)
+        root_hex, _, _ = _extract_lineage_tags(event)
+        if not isinstance(root_hex, str):
+            result["reason"] = Rejection.MISSING_TAGS
+            if m is not None:
+                m.record_check(Rejection.MISSING_TAGS, _metrics.clock() - t)
+            continue
+        pending.append((result, event, root_hex))
+
+    if pool is None:
+        for result, event, root_hex in pending:
+            result["reason"] = check_lineage(root_pubkey_hex=root_hex, event=event, cache=cache)
+    else:
+        from .parallel import _verify_status
+
+        events = [event for _, event, _ in pending]
+        roots = [root_hex for _, _, root_hex in pending]
+        if m is not None:
+            t = _metrics.clock()
+        statuses = _verify_status(events, roots, None, chunksize, pool)
+        for (result, event, root_hex), status in zip(pending, statuses):
+            if status is None:
+                # rejected before the crypto; recover the structural reason
+                result["reason"] = prevalidate_lineage(event, root_hex)
+            else:
+                result["reason"] = None if status else Rejection.BAD_SIGNATURE
+        if m is not None and pending:
+            share = (_metrics.clock() - t) / len(pending)
+            for result, _, _ in pending:
+                m.record_check(result["reason"], share)
+
+    for result, _, _ in pending:
+        result["valid"] = result["reason"] is None
+    return results
+
+
+def cmd_verify_stream(args):
+    """
+    coldroot verify --stream [events.ndjson] [--jobs N]
+
+    Reads one lineage event per line from a file or stdin ("-" or omitted)
+    and writes one JSON result per line. Exits 1 if any event is invalid.
+    With --jobs N, lines are verified in blocks across N processes.
+    """
+    from . import metrics as _metrics
+    from .cache import VerifiedLineageCache
+
+    cache = VerifiedLineageCache()
+    jobs = args.jobs or 1
+    if args.metrics_out:
+        _metrics.enable()
+
+    if args.file is None or args.file == "-":
+        src = sys.stdin
+    else:
+        path = Path(args.file)
+        if not path.exists():
+            print(f"error: file not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        src = path.open(encoding="utf-8")
+
+    pool = None
+    chunksize = args.chunksize
+    block_size = 1
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from .parallel import DEFAULT_CHUNKSIZE
+
+        chunksize = chunksize or DEFAULT_CHUNKSIZE
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        block_size = chunksize * jobs * 2
+
+    all_valid = True
+    out = sys.stdout
+    try:
+        lines = (line for line in src if line.strip())
+        while True:
+            block = list(itertools.islice(lines, block_size))
+            if not block:
+                break
+            for result in _stream_results(block, cache, pool, chunksize):
+                all_valid = all_valid and result["valid"]
+                out.write(json.dumps(result, separators=(",", ":")) + "\n")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if src is not sys.stdin:
+            src.close()
+    out.flush()
+
+    if args.metrics_out:
+        Path(args.metrics_out).write_text(_metrics.ACTIVE.to_prometheus())
+
+    if not all_valid:
+        sys.exit(1)
+
+
+def cmd_serve(args):
+    """
+    coldroot serve --socket /run/coldroot.sock
+    coldroot serve --port 7447 [--host 127.0.0.1]
+    coldroot serve --socket /run/coldroot.sock --snapshot /var/lib/coldroot/state.snap
+    """
+    from .server import serve
+
+    where = args.socket or f"{args.host}:{args.port}"
+    print(f"coldroot: serving lineage verification on {where}", file=sys.stderr)
+    serve(
+        path=args.socket,
+        host=args.host,
+        port=args.port,
+        cache_size=args.cache_size,
+        snapshot=args.snapshot,
+    )
+
+
 def extract_root_tag(event):
     """
     Small helper so the CLI can identify the root pubkey hex from the lineage event.
     """
-    for tag in event.get("tags", []):
-        if tag[0] == "root":
-            return tag[1], None, None
-    return None, None, None
+    from .lineage import _extract_lineage_tags
+
+    root_hex, _, _ = _extract_lineage_tags(event)
+    if not isinstance(root_hex, str):
+        return None, None, None
+    return root_hex, None, None
 
 
 def build_parser():
@@ -102,9 +267,23 @@ def build_parser():
 
     # verify
     v = sub.add_parser("verify", help="verify lineage JSON file")
-    v.add_argument("file", help="path to lineage.json")
+    v.add_argument("file", nargs="?", help="path to lineage.json (NDJSON with --stream, default stdin)")
+    v.add_argument("--stream", action="store_true", help="read newline-delimited events, write NDJSON results")
+    v.add_argument("--jobs", type=int, default=1, help="worker processes for --stream verification (default: 1)")
+    v.add_argument("--chunksize", type=int, help="events per worker task with --jobs (default: 512)")
+    v.add_argument("--metrics-out", help="with --stream, write Prometheus text metrics to this path")
     v.set_defaults(func=cmd_verify)
 
+    # serve
+    s = sub.add_parser("serve", help="run a verification daemon (NDJSON over a Unix socket or localhost TCP)")
+    where = s.add_mutually_exclusive_group(required=True)
+    where.add_argument("--socket", help="Unix socket path to listen on")
+    where.add_argument("--port", type=int, help="TCP port to listen on")
+    s.add_argument("--host", default="127.0.0.1", help="TCP host with --port (default: 127.0.0.1)")
+    s.add_argument("--cache-size", type=int, default=1 << 20, help="verified signature cache entries")
+    s.add_argument("--snapshot", help="load verified state from this file at startup, save it on shutdown")
+    s.set_defaults(func=cmd_serve)
+
     return p
 
 
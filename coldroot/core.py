@@ -8,6 +8,8 @@ from typing import List, Tuple
 
 from nacl import signing
 
+from . import bech32 as _bech32
+
 # ---------- HKDF (SHA-256) ----------
 
 def hkdf_sha256(ikm: bytes, salt: bytes, info: bytes, length: int = 32) -> bytes:
@@ -34,6 +36,44 @@ def hkdf_sha256(ikm: bytes, salt: bytes, info: bytes, length: int = 32) -> bytes
     return okm[:length]
 
 
+HKDF_SALT = b"nostr-cold-root"
+
+
+class RootDeriver:
+    """
+    Epoch key derivation bound to one root seed.
+
+    The HKDF-extract PRK depends only on the salt and the root seed, so it is
+    computed once and kept as a pre-keyed HMAC state. Each label then costs a
+    single HMAC copy + update for the one 32 byte expand block. Output is
+    identical to hkdf_sha256 with the SPEC.md parameters.
+    """
+
+    __slots__ = ("_expand",)
+
+    def __init__(self, root_seed: bytes):
+        if len(root_seed) != 32:
+            raise ValueError("root seed must be 32 bytes (64 hex chars)")
+        prk = hmac.new(HKDF_SALT, root_seed, hashlib.sha256).digest()
+        self._expand = hmac.new(prk, digestmod=hashlib.sha256)
+
+    @classmethod
+    def from_hex(cls, root_seed_hex: str) -> "RootDeriver":
+        return cls(binascii.unhexlify(root_seed_hex))
+
+    def derive_seed(self, epoch_label: str) -> bytes:
+        """
+        Return the 32 byte epoch seed for a label.
+        """
+        h = self._expand.copy()
+        h.update(b"epoch:" + epoch_label.encode("utf-8") + b"\x01")
+        return h.digest()
+
+    def derive(self, epoch_label: str) -> Tuple[signing.SigningKey, signing.VerifyKey]:
+        epoch_sk = signing.SigningKey(self.derive_seed(epoch_label))
+        return epoch_sk, epoch_sk.verify_key
+
+
 # ---------- Bech32 (for npub / nsec) ----------
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
@@ -91,10 +131,15 @@ def convert_bits(data: bytes, from_bits: int, to_bits: int, pad: bool = True) ->
 
 
 def nostr_bech32_encode(hrp: str, data: bytes) -> str:
-    five_bit = convert_bits(data, 8, 5, True)
-    if not five_bit:
+    """
+    Encode raw bytes as bech32 (npub / nsec).
+
+    Uses the table-driven codec in coldroot.bech32; the list-based helpers
+    above are kept as the readable reference and produce identical output.
+    """
+    if not data:
         raise ValueError("failed to convert bits for bech32")
-    return bech32_encode(hrp, five_bit)
+    return _bech32.encode(hrp, bytes(data))
 
 
 # ---------- Key helpers ----------
@@ -126,20 +171,9 @@ def derive_epoch_key(root_seed_hex: str, epoch_label: str) -> Tuple[signing.Sign
     from a 32-byte root seed (hex) and a UTF-8 epoch label.
 
     This MUST match the derivation described in SPEC.md.
+    Use RootDeriver to derive many labels from the same root.
     """
-    root_seed = binascii.unhexlify(root_seed_hex)
-    if len(root_seed) != 32:
-        raise ValueError("root seed must be 32 bytes (64 hex chars)")
-
-    child_seed = hkdf_sha256(
-        ikm=root_seed,
-        salt=b"nostr-cold-root",
-        info=b"epoch:" + epoch_label.encode("utf-8"),
-        length=32,
-    )
-    epoch_sk = signing.SigningKey(child_seed)
-    epoch_vk = epoch_sk.verify_key
-    return epoch_sk, epoch_vk
+    return RootDeriver.from_hex(root_seed_hex).derive(epoch_label)
 
 
 def npub_from_verify_key(vk: signing.VerifyKey) -> str:
@@ -0,0 +1,104 @@
+# coldroot/event.py
+
+import binascii
+from typing import Dict
+
+
+class LineageEvent:
+    """
+    Compact, bytes-native form of a lineage event.
+
+    root, pubkey and sig are decoded from hex once, in from_dict, and kept
+    as raw bytes (32, 32 and 64 bytes). The verify functions in
+    coldroot.lineage accept a LineageEvent wherever they accept an event
+    dict and skip tag extraction and hex decoding for it. Only the fields
+    defined by SPEC.md are kept: to_dict() rebuilds the event as
+    make_lineage_event produces it, so extra tags or content are dropped.
+    """
+
+    __slots__ = ("kind", "root", "pubkey", "sig", "label", "created_at")
+
+    def __init__(
+        self,
+        root: bytes,
+        pubkey: bytes,
+        sig: bytes,
+        label: str,
+        created_at: int,
+        kind: int = 30001,
+    ):
+        if len(root) != 32 or len(pubkey) != 32 or len(sig) != 64:
+            raise ValueError("root and pubkey must be 32 bytes, sig 64 bytes")
+        self.kind = kind
+        self.root = bytes(root)
+        self.pubkey = bytes(pubkey)
+        self.sig = bytes(sig)
+        self.label = label
+        self.created_at = created_at
+
+    @classmethod
+    def from_dict(cls, event: Dict) -> "LineageEvent":
+        """
+        Decode a lineage event dict. Raises ValueError if it is not a dict,
+        lacks a root, sig or epoch tag, a pubkey or an integer created_at, or if any key
+        or signature is not hex of the right length.
+        """
+        # lineage imports this module, so its tag reader is imported here
+        from .lineage import _extract_lineage_tags
+
+        if not isinstance(event, dict):
+            raise ValueError("lineage event must be a JSON object")
+        root_hex, sig_hex, label = _extract_lineage_tags(event)
+
+        pubkey_hex = event.get("pubkey")
+        created_at = event.get("created_at")
+        if not (
+            isinstance(root_hex, str)
+            and isinstance(sig_hex, str)
+            and isinstance(label, str)
+            and isinstance(pubkey_hex, str)
+        ):
+            raise ValueError("lineage event is missing pubkey, root, sig or epoch")
+        if type(created_at) is not int:
+            raise ValueError("lineage event created_at must be an integer")
+        try:
+            root = binascii.unhexlify(root_hex)
+            pubkey = binascii.unhexlify(pubkey_hex)
+            sig = binascii.unhexlify(sig_hex)
+        except binascii.Error:
+            raise ValueError("lineage event has invalid hex") from None
+        return cls(root, pubkey, sig, label, created_at, event.get("kind"))
+
+    def to_dict(self) -> Dict:
+        return {
+            "kind": self.kind,
+            "pubkey": self.pubkey.hex(),
+            "created_at": self.created_at,
+            "tags": [
+                ["root", self.root.hex()],
+                ["sig", self.sig.hex()],
+                ["epoch", self.label],
+            ],
+            "content": "",
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LineageEvent):
+            return NotImplemented
+        return (
+            self.kind == other.kind
+            and self.root == other.root
+            and self.pubkey == other.pubkey
+            and self.sig == other.sig
+            and self.label == other.label
+            and self.created_at == other.created_at
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.root, self.pubkey, self.sig))
+
+    def __repr__(self) -> str:
+        return (
+            f"LineageEvent(root={self.root.hex()[:16]}..., pubkey={self.pubkey.hex()[:16]}..., "
+            f"label={self.label!r}, created_at={self.created_at})"
+        )
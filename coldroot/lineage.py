@@ -1,13 +1,22 @@
 # coldroot/lineage.py
 
 import binascii
+import os
 import time
-from typing import Dict, Optional, Tuple
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from nacl import signing
+from nacl import bindings, signing
 from nacl.exceptions import BadSignatureError
 
+from . import metrics as _metrics
+from .cache import NegativeLineageCache, VerifiedLineageCache, root_keys
 from .core import npub_from_verify_key  # optional, if you want helpers here too
+from .event import LineageEvent
+
+# Smallest verify_lineage_batch input split across threads; each thread
+# gets at least half this many events.
+BATCH_THREAD_MIN = 64
 
 
 def make_lineage_event(
@@ -54,11 +63,18 @@ def make_lineage_event(
 def _extract_lineage_tags(event: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Internal helper to pull out (root_hex, sig_hex, epoch_label) from tags.
+
+    This is the one place event tags are read, so it must not raise on
+    untrusted input: a non-dict event or non-list tags give
+    (None, None, None), and tag entries that are not lists of at least two
+    items are skipped. Values are returned as found; callers check types.
     """
-    tags = event.get("tags", [])
     root_hex = None
     sig_hex = None
     epoch_label = None
+    tags = event.get("tags") if isinstance(event, dict) else None
+    if not isinstance(tags, list):
+        return root_hex, sig_hex, epoch_label
 
     for tag in tags:
         if not isinstance(tag, list) or len(tag) < 2:
@@ -73,44 +89,386 @@ def _extract_lineage_tags(event: Dict) -> Tuple[Optional[str], Optional[str], Op
     return root_hex, sig_hex, epoch_label
 
 
-def verify_lineage(root_pubkey_hex: str, event: Dict) -> bool:
+class Rejection(str, Enum):
     """
-    Verify a lineage event according to SPEC.md.
+    Why a lineage event was rejected.
 
-    Steps:
-    - kind must be 30001
-    - root tag must be present and match root_pubkey_hex
-    - signature must be a valid ed25519 signature by root over raw epoch pubkey bytes
+    Members are str subclasses that compare, hash and serialize as their
+    value, so code that compares against the plain reason strings keeps
+    working.
 
-    Returns:
-        True if valid, False otherwise.
+    check_lineage looks at one event in isolation and never returns the
+    last three; they are for callers that keep per-root state, such as the
+    verification service, when an event with a valid signature is refused
+    by a LineageIndex (SPEC.md sections 4.2 and 4.3).
+    """
+
+    INVALID_JSON = "invalid_json"
+    WRONG_KIND = "wrong_kind"
+    MISSING_PUBKEY = "missing_pubkey"
+    MISSING_TAGS = "missing_tags"
+    ROOT_MISMATCH = "root_mismatch"
+    BAD_LENGTH = "bad_length"
+    BAD_LABEL = "bad_label"
+    BAD_HEX = "bad_hex"
+    BAD_SIGNATURE = "bad_signature"
+    PUBKEY_REUSED = "pubkey_reused"
+    LABEL_REUSED = "label_reused"
+    BAD_CREATED_AT = "bad_created_at"
+
+    __hash__ = str.__hash__
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _lineage_fields(
+    root_pubkey_hex: Optional[str], event: Dict
+) -> Union[Rejection, Tuple[str, str, str, str]]:
     """
+    Internal helper: structural checks that need no decoding. Returns a
+    Rejection, or (root_hex, pubkey_hex, sig_hex, label) with every hex
+    field of the exact length. If root_pubkey_hex is None the root tag of
+    the event is trusted.
+    """
+    if not isinstance(event, dict):
+        return Rejection.INVALID_JSON
     if event.get("kind") != 30001:
-        return False
+        return Rejection.WRONG_KIND
 
     pubkey_hex = event.get("pubkey")
-    if not isinstance(pubkey_hex, str):
-        return False
+    if not isinstance(pubkey_hex, str) or not pubkey_hex:
+        return Rejection.MISSING_PUBKEY
 
-    root_hex, sig_hex, _ = _extract_lineage_tags(event)
-    if not (root_hex and sig_hex and pubkey_hex):
-        return False
+    root_hex, sig_hex, label = _extract_lineage_tags(event)
+    if not (isinstance(root_hex, str) and isinstance(sig_hex, str) and isinstance(label, str)):
+        return Rejection.MISSING_TAGS
+    if not (root_hex and sig_hex):
+        return Rejection.MISSING_TAGS
 
     # root in event must match expected root
-    if root_hex.lower() != root_pubkey_hex.lower():
-        return False
+    if root_pubkey_hex is not None and root_hex != root_pubkey_hex and (
+        not isinstance(root_pubkey_hex, str) or root_hex.lower() != root_pubkey_hex.lower()
+    ):
+        return Rejection.ROOT_MISMATCH
+
+    if len(pubkey_hex) != 64 or len(root_hex) != 64 or len(sig_hex) != 128:
+        return Rejection.BAD_LENGTH
+
+    # SPEC.md 4.3: the label is a UTF-8 string (JSON can smuggle in lone
+    # surrogates that have no UTF-8 encoding)
+    if not label.isascii():
+        try:
+            label.encode("utf-8")
+        except UnicodeEncodeError:
+            return Rejection.BAD_LABEL
 
+    return root_hex, pubkey_hex, sig_hex, label
+
+
+def _decode_hex(
+    root_hex: str, pubkey_hex: str, sig_hex: str
+) -> Union[Rejection, Tuple[bytes, bytes, bytes]]:
     try:
-        root_pub = binascii.unhexlify(root_hex)
-        epoch_pub = binascii.unhexlify(pubkey_hex)
-        sig = binascii.unhexlify(sig_hex)
+        return (
+            binascii.unhexlify(root_hex),
+            binascii.unhexlify(pubkey_hex),
+            binascii.unhexlify(sig_hex),
+        )
     except (binascii.Error, ValueError):
-        return False
+        return Rejection.BAD_HEX
+
+
+def prevalidate_lineage(event: Dict, root_pubkey_hex: Optional[str] = None) -> Optional[Rejection]:
+    """
+    Cheap structural validation of a lineage event, with no cryptography.
+
+    Checks the kind, the pubkey and the root/sig/epoch tags, the exact
+    length and charset of every hex field, that the label is valid UTF-8
+    and, if root_pubkey_hex is given, that the root tag matches it.
+    Returns None if the event is well formed, otherwise a Rejection.
+    Garbage rejected here never costs an ed25519 verify.
+    """
+    fields = _lineage_fields(root_pubkey_hex, event)
+    if type(fields) is Rejection:
+        return fields
+    decoded = _decode_hex(fields[0], fields[1], fields[2])
+    return decoded if type(decoded) is Rejection else None
+
+
+def check_lineage(
+    root_pubkey_hex: str,
+    event: Dict,
+    cache: Optional[VerifiedLineageCache] = None,
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> Optional[Rejection]:
+    """
+    Run the verify_lineage checks and report why an event was rejected.
+
+    The prevalidate_lineage checks run first, so malformed events are
+    rejected before any signature work. cache, negative_cache and source
+    are as for verify_lineage.
+
+    Returns:
+        None if the event is valid, otherwise a Rejection (a str enum:
+        "invalid_json", "wrong_kind", "missing_pubkey", "missing_tags",
+        "root_mismatch", "bad_length", "bad_label", "bad_hex" or
+        "bad_signature").
+    """
+    m = _metrics.ACTIVE
+    if m is None:
+        return _check_lineage(root_pubkey_hex, event, cache, None, negative_cache, source)
+
+    start = _metrics.clock()
+    reason = _check_lineage(root_pubkey_hex, event, cache, m, negative_cache, source)
+    m.record_check(reason, _metrics.clock() - start)
+    return reason
+
+
+def _check_lineage(
+    root_pubkey_hex: str,
+    event: Dict,
+    cache: Optional[VerifiedLineageCache],
+    m: Optional[_metrics.Metrics],
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> Optional[Rejection]:
+    """
+    Internal body of check_lineage; per-stage timings go to m if given.
+    """
+    if type(event) is LineageEvent:
+        return _check_lineage_event(root_pubkey_hex, event, cache, m, negative_cache, source)
+
+    if m is not None:
+        t = _metrics.clock()
+    fields = _lineage_fields(root_pubkey_hex, event)
+    if m is not None:
+        m.observe("extract_tags", _metrics.clock() - t)
+    if type(fields) is Rejection:
+        return fields
+    if root_pubkey_hex is None:
+        # only the batch helpers may trust the event's own root tag
+        return Rejection.ROOT_MISMATCH
+    root_hex, pubkey_hex, sig_hex, _ = fields
+
+    if negative_cache is not None:
+        negative_key = negative_cache.key(root_hex, pubkey_hex, sig_hex)
+        if negative_cache.contains(negative_key, source):
+            return Rejection.BAD_SIGNATURE
+
+    if cache is not None:
+        cache_key = cache.key(root_hex, pubkey_hex, sig_hex)
+        if cache.contains(cache_key):
+            return None
+
+    if m is not None:
+        t = _metrics.clock()
+    decoded = _decode_hex(root_hex, pubkey_hex, sig_hex)
+    if type(decoded) is Rejection:
+        return decoded
+    _, epoch_pub, sig = decoded
+    vk = root_keys.get(root_hex)
+    if m is not None:
+        m.observe("hex_decode", _metrics.clock() - t)
+        t = _metrics.clock()
 
     try:
-        vk = signing.VerifyKey(root_pub)
         vk.verify(epoch_pub, sig)
     except BadSignatureError:
-        return False
+        if negative_cache is not None:
+            negative_cache.add(negative_key, source)
+        return Rejection.BAD_SIGNATURE
+    finally:
+        if m is not None:
+            m.observe("verify", _metrics.clock() - t)
+
+    if cache is not None:
+        cache.add(cache_key)
+    return None
+
+
+def _check_event_fields(root_pubkey_hex: Optional[str], event: LineageEvent) -> Optional[Rejection]:
+    """
+    Internal helper: the structural checks that still apply to a LineageEvent.
+    """
+    if event.kind != 30001:
+        return Rejection.WRONG_KIND
+    if root_pubkey_hex is not None and (
+        not isinstance(root_pubkey_hex, str) or event.root.hex() != root_pubkey_hex.lower()
+    ):
+        return Rejection.ROOT_MISMATCH
+    try:
+        event.label.encode("utf-8")
+    except (AttributeError, UnicodeEncodeError):
+        return Rejection.BAD_LABEL
+    return None
+
+
+def _check_lineage_event(
+    root_pubkey_hex: str,
+    event: LineageEvent,
+    cache: Optional[VerifiedLineageCache],
+    m: Optional[_metrics.Metrics],
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> Optional[Rejection]:
+    """
+    check_lineage for a LineageEvent: fields are already decoded bytes, so
+    only the root comparison, the label check and the signature check
+    remain. Cache keys match the dict form, so both forms share one cache.
+    """
+    reason = _check_event_fields(root_pubkey_hex, event)
+    if reason is not None:
+        return reason
+    if root_pubkey_hex is None:
+        return Rejection.ROOT_MISMATCH
+    root_hex = event.root.hex()
+
+    if negative_cache is not None:
+        negative_key = (root_hex, event.pubkey.hex(), event.sig.hex())
+        if negative_cache.contains(negative_key, source):
+            return Rejection.BAD_SIGNATURE
+
+    if cache is not None:
+        cache_key = (root_hex, event.pubkey.hex(), event.sig.hex())
+        if cache.contains(cache_key):
+            return None
+
+    vk = root_keys.get(root_hex)
+    if m is not None:
+        t = _metrics.clock()
+    try:
+        vk.verify(event.pubkey, event.sig)
+    except BadSignatureError:
+        if negative_cache is not None:
+            negative_cache.add(negative_key, source)
+        return Rejection.BAD_SIGNATURE
+    finally:
+        if m is not None:
+            m.observe("verify", _metrics.clock() - t)
+
+    if cache is not None:
+        cache.add(cache_key)
+    return None
+
+
+def verify_lineage(
+    root_pubkey_hex: str,
+    event: Dict,
+    cache: Optional[VerifiedLineageCache] = None,
+    negative_cache: Optional[NegativeLineageCache] = None,
+    source: Optional[str] = None,
+) -> bool:
+    """
+    Verify a lineage event according to SPEC.md.
+
+    Steps:
+    - kind must be 30001
+    - root tag must be present and match root_pubkey_hex
+    - signature must be a valid ed25519 signature by root over raw epoch pubkey bytes
+
+    If cache is given, a (root, pubkey, sig) triple that verified before is
+    accepted without decoding or re-running the signature check.
+
+    If negative_cache is given, a triple whose signature check failed
+    within its ttl is rejected without re-running the check; source (e.g.
+    a relay URL) is only used for its per-source counters.
 
-    return True
+    event may also be a LineageEvent, whose fields are already decoded.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    return (
+        check_lineage(root_pubkey_hex, event, cache=cache, negative_cache=negative_cache, source=source)
+        is None
+    )
+
+
+def _decode_lineage(
+    root_pubkey_hex: Optional[str], event: Dict
+) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """
+    Internal helper for the batch path: run the structural checks from
+    verify_lineage and return raw (root_pub, epoch_pub, sig) bytes, or None
+    if the event is rejected before the signature check.
+
+    If root_pubkey_hex is None the root tag of the event is trusted.
+    """
+    if type(event) is LineageEvent:
+        if _check_event_fields(root_pubkey_hex, event) is not None:
+            return None
+        return event.root, event.pubkey, event.sig
+
+    fields = _lineage_fields(root_pubkey_hex, event)
+    if type(fields) is Rejection:
+        return None
+    decoded = _decode_hex(fields[0], fields[1], fields[2])
+    if type(decoded) is Rejection:
+        return None
+    return decoded
+
+
+def _expected_roots(
+    events: List[Dict],
+    expected_roots: Optional[Union[str, Sequence[Optional[str]]]],
+) -> Sequence[Optional[str]]:
+    """
+    Internal helper: expand the expected_roots argument of the batch APIs
+    into one entry per event.
+    """
+    if expected_roots is None or isinstance(expected_roots, str):
+        return [expected_roots] * len(events)
+    expected = list(expected_roots)
+    if len(expected) != len(events):
+        raise ValueError("expected_roots must have one entry per event")
+    return expected
+
+
+def verify_lineage_batch(
+    events: Iterable[Dict],
+    expected_roots: Optional[Union[str, Sequence[Optional[str]]]] = None,
+    jobs: Optional[int] = None,
+) -> List[bool]:
+    """
+    Verify many lineage events in one call.
+
+    expected_roots may be:
+    - None: each event is checked against its own root tag
+    - a root pubkey hex string: every event must belong to that root
+    - a sequence parallel to events (None entries fall back to the root tag)
+
+    PyNaCl has no multi-signature ed25519 batch verify, so the gain comes
+    from parallelism: libsodium runs without the GIL, and batches of at
+    least BATCH_THREAD_MIN events are split across jobs threads (default:
+    CPU count) through verify_lineage_parallel. jobs=1, or a single CPU,
+    checks them one by one in the calling thread. Results are per event,
+    in input order, with the same semantics as calling verify_lineage on
+    each one, so every bad event is named.
+    """
+    events = list(events)
+    expected = _expected_roots(events, expected_roots)
+
+    workers = min(jobs or os.cpu_count() or 1, len(events) // (BATCH_THREAD_MIN // 2))
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .parallel import verify_lineage_parallel
+
+        chunksize = -(-len(events) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return verify_lineage_parallel(events, expected, chunksize=chunksize, executor=pool)
+
+    results = [False] * len(events)
+    for i, event in enumerate(events):
+        decoded = _decode_lineage(expected[i], event)
+        if decoded is None:
+            continue
+        root_pub, epoch_pub, sig = decoded
+        try:
+            bindings.crypto_sign_open(sig + epoch_pub, root_pub)
+        except (BadSignatureError, ValueError):
+            continue
+        results[i] = True
+    return results
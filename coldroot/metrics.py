@@ -0,0 +1,150 @@
+# coldroot/metrics.py
+
+"""
+Optional hot-path instrumentation for lineage handling.
+
+Disabled by default: instrumented code does a single module attribute
+check (ACTIVE is None) and skips all timing. Call enable() to start
+collecting per-stage latency histograms and per-reason rejection counters,
+and add_hook() to receive every (stage, seconds) timing.
+
+Stages recorded by coldroot:
+- "parse":        JSON decoding of an incoming event (CLI stream mode)
+- "extract_tags": pulling root / sig / epoch out of the tags list
+- "hex_decode":   root key lookup and hex decoding of pubkey and sig
+- "verify":       the ed25519 signature check
+- "check":        a full check_lineage call
+"""
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+Hook = Callable[[str, float], None]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 5e-3, 1e-2, 1e-1,
+)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class Metrics:
+    """
+    Counters and latency histograms for lineage handling.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.stages: Dict[str, Histogram] = {}
+        self.results: Dict[str, int] = {}
+        self.rejections: Dict[str, int] = {}
+        self.hooks: List[Hook] = []
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            hist = self.stages.get(stage)
+            if hist is None:
+                hist = self.stages[stage] = Histogram(self.buckets)
+            hist.observe(seconds)
+        for hook in self.hooks:
+            hook(stage, seconds)
+
+    def record_check(self, reason: Optional[str], seconds: float) -> None:
+        """
+        Record one finished lineage check and its rejection reason, if any.
+        """
+        result = "valid" if reason is None else "invalid"
+        with self._lock:
+            self.results[result] = self.results.get(result, 0) + 1
+            if reason is not None:
+                self.rejections[reason] = self.rejections.get(reason, 0) + 1
+        self.observe("check", seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages.clear()
+            self.results.clear()
+            self.rejections.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            lines = [
+                "# HELP coldroot_lineage_checks_total Lineage events checked, by result.",
+                "# TYPE coldroot_lineage_checks_total counter",
+            ]
+            for result, n in sorted(self.results.items()):
+                lines.append(f'coldroot_lineage_checks_total{{result="{result}"}} {n}')
+
+            lines += [
+                "# HELP coldroot_lineage_rejections_total Rejected lineage events, by reason.",
+                "# TYPE coldroot_lineage_rejections_total counter",
+            ]
+            for reason, n in sorted(self.rejections.items()):
+                lines.append(f'coldroot_lineage_rejections_total{{reason="{reason}"}} {n}')
+
+            lines += [
+                "# HELP coldroot_stage_seconds Time spent per lineage handling stage.",
+                "# TYPE coldroot_stage_seconds histogram",
+            ]
+            for stage, hist in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, n in zip(hist.bounds, hist.counts):
+                    cumulative += n
+                    lines.append(f'coldroot_stage_seconds_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'coldroot_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {hist.count}')
+                lines.append(f'coldroot_stage_seconds_sum{{stage="{stage}"}} {hist.total!r}')
+                lines.append(f'coldroot_stage_seconds_count{{stage="{stage}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+
+# The active Metrics instance, or None when instrumentation is off.
+ACTIVE: Optional[Metrics] = None
+
+clock = time.perf_counter
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """
+    Turn instrumentation on, optionally with a caller-owned Metrics.
+    """
+    global ACTIVE
+    ACTIVE = metrics if metrics is not None else Metrics()
+    return ACTIVE
+
+
+def disable() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a callable(stage, seconds) on the active Metrics.
+    """
+    if ACTIVE is None:
+        raise RuntimeError("metrics are not enabled")
+    ACTIVE.hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    if ACTIVE is not None and hook in ACTIVE.hooks:
+        ACTIVE.hooks.remove(hook)
@@ -0,0 +1,140 @@
+# coldroot/nip01.py
+
+"""
+NIP-01 event ids and event signatures for lineage events.
+
+The id is the sha256 of the canonical serialization
+
+    [0, <pubkey hex>, <created_at>, <kind>, <tags>, <content>]
+
+as compact UTF-8 JSON. The event-level "sig" is made by the epoch key (the
+event's pubkey) over the 32 byte id, which is what SPEC.md section 5
+checks: the pubkey in a lineage event must be the key that signed it.
+Epoch keys in this implementation are ed25519, so the signature is ed25519
+over the id rather than NIP-01's BIP-340 Schnorr.
+
+Each event is serialized once; the same digest serves as the id and as
+the signed message.
+"""
+
+import binascii
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+from nacl import bindings, signing
+from nacl.exceptions import BadSignatureError
+
+# One shared encoder: json.dumps builds a new one per call for
+# non-default separators.
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _serialize(event: Dict, _encode=_encoder.encode) -> bytes:
+    """
+    The one copy of the canonical form; _encode is bound at definition
+    time so the batch loops pay no attribute lookups.
+    """
+    return _encode(
+        [0, event["pubkey"], event["created_at"], event["kind"], event["tags"], event["content"]]
+    ).encode("utf-8")
+
+
+def serialize_event(event: Dict) -> bytes:
+    """
+    Canonical NIP-01 serialization of an event, as UTF-8 bytes.
+    """
+    return _serialize(event)
+
+
+def event_id_bytes(event: Dict) -> bytes:
+    return hashlib.sha256(_serialize(event)).digest()
+
+
+def event_id(event: Dict) -> str:
+    """
+    NIP-01 event id: hex sha256 of the canonical serialization.
+    """
+    return hashlib.sha256(_serialize(event)).hexdigest()
+
+
+def sign_event(event: Dict, epoch_sk: signing.SigningKey) -> Dict:
+    """
+    Fill in "id" and "sig" on an event (in place, also returned).
+
+    Raises ValueError if epoch_sk is not the key named by the event's pubkey.
+    """
+    if epoch_sk.verify_key.encode().hex() != str(event.get("pubkey", "")).lower():
+        raise ValueError("signing key does not match event pubkey")
+    digest = event_id_bytes(event)
+    event["id"] = digest.hex()
+    event["sig"] = epoch_sk.sign(digest).signature.hex()
+    return event
+
+
+def check_event(event: Dict) -> Optional[str]:
+    """
+    Check the event id and event signature.
+
+    Returns None if both are valid, otherwise "missing_fields", "bad_id",
+    "bad_hex" or "bad_signature".
+    """
+    try:
+        digest = event_id_bytes(event)
+    except (KeyError, TypeError, ValueError):
+        return "missing_fields"
+    id_hex = event.get("id")
+    sig_hex = event.get("sig")
+    pubkey_hex = event.get("pubkey")
+    if not isinstance(id_hex, str) or not isinstance(sig_hex, str) or not isinstance(pubkey_hex, str):
+        return "missing_fields"
+    if id_hex.lower() != digest.hex():
+        return "bad_id"
+    try:
+        sig = binascii.unhexlify(sig_hex)
+        pubkey = binascii.unhexlify(pubkey_hex)
+    except (binascii.Error, ValueError):
+        return "bad_hex"
+    if len(sig) != 64 or len(pubkey) != 32:
+        return "bad_hex"
+    try:
+        bindings.crypto_sign_open(sig + digest, pubkey)
+    except (BadSignatureError, ValueError):
+        return "bad_signature"
+    return None
+
+
+def verify_event(event: Dict) -> bool:
+    """
+    True if the event's id matches its content and its sig was made by
+    the key in its pubkey field.
+    """
+    return check_event(event) is None
+
+
+def compute_ids(events: Iterable[Dict]) -> List[str]:
+    """
+    NIP-01 ids for many events, in order.
+    """
+    serialize = _serialize
+    sha256 = hashlib.sha256
+    return [sha256(serialize(e)).hexdigest() for e in events]
+
+
+def check_ids(events: Iterable[Dict]) -> List[bool]:
+    """
+    For many events, whether each carries an "id" matching its content.
+    Malformed events are False.
+    """
+    serialize = _serialize
+    sha256 = hashlib.sha256
+    results = []
+    for e in events:
+        try:
+            digest = sha256(serialize(e)).hexdigest()
+        except (KeyError, TypeError, ValueError):
+            results.append(False)
+            continue
+        id_hex = e.get("id")
+        results.append(isinstance(id_hex, str) and id_hex.lower() == digest)
+    return results
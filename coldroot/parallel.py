@@ -0,0 +1,112 @@
+# coldroot/parallel.py
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from nacl import bindings
+from nacl.exceptions import BadSignatureError
+
+from .lineage import _decode_lineage, _expected_roots
+
+# root pubkey (32) | epoch pubkey (32) | signature (64)
+RECORD_SIZE = 128
+DEFAULT_CHUNKSIZE = 512
+
+
+def pack_lineage(root_pubkey_hex: Optional[str], event: Dict) -> Optional[bytes]:
+    """
+    Run the structural verify_lineage checks in the calling process and
+    pack the event into a fixed 128 byte record for a worker, or return
+    None if the event is rejected before the signature check.
+    """
+    decoded = _decode_lineage(root_pubkey_hex, event)
+    if decoded is None:
+        return None
+    root_pub, epoch_pub, sig = decoded
+    return root_pub + epoch_pub + sig
+
+
+def verify_packed(chunk: bytes) -> bytes:
+    """
+    Worker entry point: verify packed records, one result byte (0 or 1)
+    per record, in order.
+    """
+    count = len(chunk) // RECORD_SIZE
+    out = bytearray(count)
+    for i in range(count):
+        off = i * RECORD_SIZE
+        root_pub = chunk[off:off + 32]
+        signed = chunk[off + 64:off + 128] + chunk[off + 32:off + 64]
+        try:
+            bindings.crypto_sign_open(signed, root_pub)
+        except (BadSignatureError, ValueError):
+            continue
+        out[i] = 1
+    return bytes(out)
+
+
+def _verify_status(
+    events: List[Dict],
+    expected_roots: Optional[Union[str, Sequence[Optional[str]]]],
+    jobs: Optional[int],
+    chunksize: int,
+    executor: Optional[Executor],
+) -> List[Optional[bool]]:
+    """
+    Internal helper: None for events rejected before the crypto,
+    otherwise the signature check result.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    expected = _expected_roots(events, expected_roots)
+
+    status: List[Optional[bool]] = [None] * len(events)
+    positions: List[int] = []
+    records = bytearray()
+    for i, event in enumerate(events):
+        record = pack_lineage(expected[i], event)
+        if record is not None:
+            positions.append(i)
+            records += record
+
+    step = chunksize * RECORD_SIZE
+    chunks = [bytes(records[off:off + step]) for off in range(0, len(records), step)]
+    if not chunks:
+        return status
+
+    if executor is not None:
+        verdicts = executor.map(verify_packed, chunks)
+    elif (jobs or os.cpu_count() or 1) == 1 or len(chunks) == 1:
+        verdicts = map(verify_packed, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            verdicts = list(pool.map(verify_packed, chunks))
+
+    it = iter(positions)
+    for verdict in verdicts:
+        for ok in verdict:
+            status[next(it)] = bool(ok)
+    return status
+
+
+def verify_lineage_parallel(
+    events: Iterable[Dict],
+    expected_roots: Optional[Union[str, Sequence[Optional[str]]]] = None,
+    jobs: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Optional[Executor] = None,
+) -> List[bool]:
+    """
+    Verify lineage events across processes.
+
+    Structural checks run here; only compact 128 byte records are sent to
+    workers, chunksize records per task. Pass executor to reuse a pool
+    across calls, otherwise a ProcessPoolExecutor with jobs workers
+    (default: CPU count) is created for this call. jobs=1 runs inline.
+
+    expected_roots follows verify_lineage_batch. Results are in input
+    order with the same semantics as verify_lineage.
+    """
+    events = list(events)
+    return [bool(s) for s in _verify_status(events, expected_roots, jobs, chunksize, executor)]
@@ -5,12 +5,13 @@ This wraps the internal core + lineage implementation into a minimal,
 stable surface that the vector generator and tests can depend on.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from nacl import signing
 
 from coldroot.core import derive_epoch_key as _derive_epoch_key_impl
 from coldroot.lineage import make_lineage_event as _make_lineage_event_impl
+from coldroot.nip01 import sign_event as _sign_event_impl
 
 import datetime as _dt
 
@@ -83,18 +84,28 @@ def derive_epoch_key(root_sk: bytes, label: str) -> bytes:
     epoch_sk_obj, epoch_vk_obj = _derive_epoch_key_impl(root_seed_hex, label)
     return epoch_sk_obj.encode()  # 32-byte epoch secret key
 
-def build_lineage_event(root_sk: bytes, epoch_pk: bytes, label: str) -> Dict[str, Any]:
+def build_lineage_event(
+    root_sk: bytes, epoch_pk: bytes, label: str, epoch_sk: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    Build the lineage event for an epoch. If epoch_sk is given, the NIP-01
+    event "id" and "sig" are filled in as well (coldroot.nip01); the v1
+    vectors leave them null.
+    """
     root_sk_obj = signing.SigningKey(root_sk)
     epoch_vk_obj = signing.VerifyKey(epoch_pk)
 
     created_at = _deterministic_created_at(label)
 
-    return _make_lineage_event_impl(
+    event = _make_lineage_event_impl(
         root_sk=root_sk_obj,
         epoch_vk=epoch_vk_obj,
         epoch_label=label,
         created_at=created_at,
     )
+    if epoch_sk is not None:
+        _sign_event_impl(event, signing.SigningKey(epoch_sk))
+    return event
 
 
 
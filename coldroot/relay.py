@@ -0,0 +1,312 @@
+# coldroot/relay.py
+
+"""
+Asyncio ingestion of lineage events from Nostr relays.
+
+LineageIngestor subscribes to kind 30001 on a relay connection, pushes
+incoming events through a bounded queue (a slow verifier stops the reader,
+which in turn stops reading from the socket), verifies them in batches
+with verify_lineage on an executor, and feeds the valid ones into a
+LineageIndex on the event loop thread.
+
+A connection is anything with async send(str), recv() -> str and close();
+recv() raises EOFError once the connection is gone. subscribe_websocket()
+adapts a `websockets` client connection (optional dependency, install with
+`pip install websockets`). LocalRelay is an in-process stand-in speaking
+the same NIP-01 messages, for tests and load tests without a network.
+"""
+
+import asyncio
+import json
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .cache import NegativeLineageCache
+from .chain import LineageIndex
+from .lineage import Rejection, _extract_lineage_tags, check_lineage, prevalidate_lineage
+
+LINEAGE_FILTER = {"kinds": [30001]}
+
+# Largest websocket frame read from a relay. A lineage event is well under
+# 1 KiB; the bound keeps one oversized frame from being buffered whole
+# before the ingest queue can apply backpressure.
+MAX_FRAME = 4 * 1024 * 1024
+
+
+def _verify_events(events: List[Dict]) -> List[Optional[Rejection]]:
+    """
+    Executor job: check each event against its own root tag.
+    """
+    results = []
+    for event in events:
+        root_hex, _, _ = _extract_lineage_tags(event)
+        if not isinstance(root_hex, str):
+            results.append(Rejection.MISSING_TAGS)
+        else:
+            results.append(check_lineage(root_hex, event))
+    return results
+
+
+def _fingerprint(event: Dict):
+    root_hex, sig_hex, _ = _extract_lineage_tags(event)
+    pubkey_hex = event.get("pubkey")
+    if not (isinstance(root_hex, str) and isinstance(sig_hex, str) and isinstance(pubkey_hex, str)):
+        return None
+    return NegativeLineageCache.key(root_hex, pubkey_hex, sig_hex)
+
+
+class LineageIngestor:
+    """
+    Relay subscription -> bounded queue -> executor verification -> index.
+
+    Events from the relay are untrusted. Malformed ones (prevalidate_lineage
+    fails) are rejected on the event loop, counted in both "rejected" and
+    "malformed", and never reach the executor or the index.
+
+    With a negative_cache, forged events seen before (bad signature within
+    the cache's ttl) are dropped on the event loop before they are queued
+    for verification; the cache is only touched from the loop thread.
+    """
+
+    def __init__(
+        self,
+        index: Optional[LineageIndex] = None,
+        executor: Optional[Executor] = None,
+        queue_size: int = 4096,
+        batch_size: int = 256,
+        negative_cache: Optional[NegativeLineageCache] = None,
+    ):
+        self.index = index if index is not None else LineageIndex()
+        self.executor = executor
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.negative_cache = negative_cache
+        self.stats = {"received": 0, "skipped": 0, "dropped": 0, "accepted": 0, "rejected": 0, "malformed": 0}
+
+    async def ingest(
+        self,
+        connection: Any,
+        filters: Optional[Dict] = None,
+        subscription_id: str = "coldroot-lineage",
+        until_eose: bool = False,
+        source: Optional[str] = None,
+    ) -> None:
+        """
+        Subscribe and process events until the connection closes, or until
+        the relay signals end of stored events when until_eose is True.
+        source names the relay in the negative cache's counters.
+        """
+        queue: "asyncio.Queue[Optional[Dict]]" = asyncio.Queue(maxsize=self.queue_size)
+        await connection.send(json.dumps(["REQ", subscription_id, filters or LINEAGE_FILTER]))
+        reader = asyncio.create_task(self._read(connection, queue, subscription_id, until_eose))
+        try:
+            await self._process(queue, source)
+            await reader
+        finally:
+            if not reader.done():
+                reader.cancel()
+
+    async def _read(self, connection, queue, subscription_id, until_eose) -> None:
+        try:
+            while True:
+                try:
+                    raw = await connection.recv()
+                except EOFError:
+                    break
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+                if not isinstance(message, list) or len(message) < 2 or message[1] != subscription_id:
+                    continue
+                if message[0] == "EVENT" and len(message) >= 3 and isinstance(message[2], dict):
+                    self.stats["received"] += 1
+                    await queue.put(message[2])
+                elif message[0] == "EOSE" and until_eose:
+                    await connection.send(json.dumps(["CLOSE", subscription_id]))
+                    break
+                elif message[0] == "CLOSED":
+                    break
+        finally:
+            await queue.put(None)
+
+    def _is_known(self, event: Dict) -> bool:
+        root_hex, _, _ = _extract_lineage_tags(event)
+        pubkey_hex = event.get("pubkey")
+        if not isinstance(root_hex, str) or not isinstance(pubkey_hex, str):
+            return False
+        chain = self.index.chain(root_hex)
+        return chain is not None and chain.has_pubkey(pubkey_hex)
+
+    def _is_known_bad(self, event: Dict, source: Optional[str]) -> bool:
+        key = _fingerprint(event)
+        return key is not None and self.negative_cache.contains(key, source)
+
+    async def _process(self, queue, source: Optional[str] = None) -> None:
+        loop = asyncio.get_running_loop()
+        negative = self.negative_cache
+        done = False
+        while not done:
+            batch = []
+            item = await queue.get()
+            while True:
+                if item is None:
+                    done = True
+                    break
+                if prevalidate_lineage(item) is not None:
+                    self.stats["malformed"] += 1
+                    self.stats["rejected"] += 1
+                elif self._is_known(item):
+                    # re-delivered by another relay or a re-subscription
+                    self.stats["skipped"] += 1
+                elif negative is not None and self._is_known_bad(item, source):
+                    self.stats["dropped"] += 1
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size or queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if not batch:
+                continue
+            results = await loop.run_in_executor(self.executor, _verify_events, batch)
+            for event, reason in zip(batch, results):
+                if reason is None and self.index.add(event, verify=False):
+                    self.stats["accepted"] += 1
+                    continue
+                self.stats["rejected"] += 1
+                if reason is Rejection.BAD_SIGNATURE and negative is not None:
+                    negative.add(_fingerprint(event), source)
+
+
+def _matches(event: Dict, filters: Dict) -> bool:
+    kinds = filters.get("kinds")
+    if kinds is not None and event.get("kind") not in kinds:
+        return False
+    authors = filters.get("authors")
+    if authors is not None and event.get("pubkey") not in authors:
+        return False
+    since = filters.get("since")
+    if since is not None and event.get("created_at", 0) < since:
+        return False
+    return True
+
+
+class LocalRelayConnection:
+    """
+    Client side of a LocalRelay connection (same interface as a websocket).
+    """
+
+    def __init__(self, relay: "LocalRelay", queue_size: int):
+        self._relay = relay
+        self._outbox: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=queue_size)
+        self._subs: Dict[str, Dict] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.closed = False
+
+    async def send(self, message: str) -> None:
+        msg = json.loads(message)
+        if msg[0] == "REQ":
+            sub_id, filters = msg[1], msg[2] if len(msg) > 2 else {}
+            self._subs[sub_id] = filters
+            self._tasks.append(asyncio.create_task(self._backfill(sub_id, filters)))
+        elif msg[0] == "CLOSE":
+            self._subs.pop(msg[1], None)
+
+    async def _backfill(self, sub_id: str, filters: Dict) -> None:
+        for event in list(self._relay.events):
+            if _matches(event, filters):
+                await self._outbox.put(json.dumps(["EVENT", sub_id, event]))
+        await self._outbox.put(json.dumps(["EOSE", sub_id]))
+
+    async def deliver(self, event: Dict) -> None:
+        for sub_id, filters in list(self._subs.items()):
+            if _matches(event, filters):
+                await self._outbox.put(json.dumps(["EVENT", sub_id, event]))
+
+    async def recv(self) -> str:
+        if self.closed and self._outbox.empty():
+            raise EOFError("connection closed")
+        message = await self._outbox.get()
+        if message is None:
+            raise EOFError("connection closed")
+        return message
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        for task in self._tasks:
+            task.cancel()
+        self._relay._connections.discard(self)
+        await self._outbox.put(None)
+
+
+class LocalRelay:
+    """
+    In-process relay stand-in: stores events, answers REQ with stored
+    matches then EOSE, and pushes publish()ed events to live subscriptions.
+    Each connection has a bounded outbox, so a slow client applies
+    backpressure to the relay just like a real socket would.
+    """
+
+    def __init__(self, events: Iterable[Dict] = (), queue_size: int = 1024):
+        self.events: List[Dict] = list(events)
+        self.queue_size = queue_size
+        self._connections = set()
+
+    def connect(self) -> LocalRelayConnection:
+        conn = LocalRelayConnection(self, self.queue_size)
+        self._connections.add(conn)
+        return conn
+
+    async def publish(self, event: Dict) -> None:
+        self.events.append(event)
+        for conn in list(self._connections):
+            await conn.deliver(event)
+
+    async def close(self) -> None:
+        for conn in list(self._connections):
+            await conn.close()
+
+
+class _WebsocketConnection:
+    """
+    Adapter mapping websockets' ConnectionClosed to EOFError.
+    """
+
+    def __init__(self, ws, closed_exc):
+        self._ws = ws
+        self._closed_exc = closed_exc
+
+    async def send(self, message: str) -> None:
+        await self._ws.send(message)
+
+    async def recv(self) -> str:
+        try:
+            return await self._ws.recv()
+        except self._closed_exc:
+            raise EOFError("connection closed") from None
+
+    async def close(self) -> None:
+        await self._ws.close()
+
+
+async def subscribe_websocket(
+    url: str,
+    ingestor: LineageIngestor,
+    max_frame: int = MAX_FRAME,
+    **kwargs,
+) -> None:
+    """
+    Connect to a relay at url and run ingestor.ingest on it. Frames larger
+    than max_frame bytes close the connection. kwargs are passed to
+    ingest(). Requires the optional `websockets` package.
+    """
+    try:
+        import websockets
+    except ImportError:
+        raise ImportError("relay subscriptions need the 'websockets' package: pip install websockets") from None
+
+    async with websockets.connect(url, max_size=max_frame) as ws:
+        await ingestor.ingest(_WebsocketConnection(ws, websockets.ConnectionClosed), **kwargs)
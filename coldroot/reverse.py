@@ -0,0 +1,188 @@
+# coldroot/reverse.py
+
+"""
+Reverse index: epoch pubkey -> root pubkey, for attributing incoming notes
+to a Cold Root identity.
+
+Most pubkeys seen on a relay belong to no lineage, so lookups go through a
+Bloom filter first. A miss is answered from a few bit tests on the
+caller's pubkey string without hex decoding or touching the dict. The
+filter uses Python's per-process randomized hash() of the lowercase hex
+pubkey; str objects cache their hash, so the event's own pubkey string is
+hashed at most once.
+
+Attribution is first come, first served, so the index only accepts proof
+from both sides. The root signature over the epoch pubkey alone is not
+enough: any root can sign any pubkey, and one that claims a victim's epoch
+key first would lock the real root out. Events are therefore also checked
+with nip01.verify_event (SPEC.md section 5): the epoch key itself must have
+signed the event that names its root.
+"""
+
+import binascii
+import math
+from typing import Dict, List, Optional
+
+from .chain import LineageIndex
+from .lineage import _extract_lineage_tags, verify_lineage
+from .nip01 import verify_event
+
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over hashable keys, sized for capacity keys at
+    error_rate false positives. Exceeding capacity raises the false
+    positive rate but never causes false negatives.
+    """
+
+    __slots__ = ("size", "hashes", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.size = max(8, bits)
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        h = hash(key) & _MASK64
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, key) -> None:
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key) -> bool:
+        h = hash(key) & _MASK64
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        size = self.size
+        bits = self._bits
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class EpochRootIndex:
+    """
+    Epoch pubkey -> root pubkey map built from verified lineage events.
+
+    Epoch pubkeys are stored as 32 raw bytes and roots are interned, so
+    each entry costs one bytes object plus a dict slot. max_keys bounds the
+    number of entries; add() refuses new keys once it is reached.
+
+    Lookups take hex pubkeys as they appear in NIP-01 events; lowercase
+    is the fast path, other case is folded first.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        max_keys: Optional[int] = None,
+    ):
+        self.max_keys = max_keys
+        self.bloom = BloomFilter(capacity, error_rate)
+        self._keys: Dict[bytes, int] = {}
+        self._roots: List[str] = []
+        self._root_ids: Dict[str, int] = {}
+        self.false_positives = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add_pubkey(self, epoch_pubkey_hex: str, root_pubkey_hex: str) -> bool:
+        """
+        Map an already verified epoch pubkey to its root. Returns False if
+        the index is full, the pubkey is malformed or already maps to a
+        different root. The caller must have checked both the root
+        signature and the epoch key's event signature; see add().
+        """
+        pubkey_hex = epoch_pubkey_hex.lower()
+        try:
+            raw = binascii.unhexlify(pubkey_hex)
+        except (binascii.Error, ValueError):
+            return False
+        if len(raw) != 32:
+            return False
+
+        root = root_pubkey_hex.lower()
+        root_id = self._root_ids.get(root)
+        existing = self._keys.get(raw)
+        if existing is not None:
+            return existing == root_id
+        if self.max_keys is not None and len(self._keys) >= self.max_keys:
+            return False
+
+        if root_id is None:
+            root_id = self._root_ids[root] = len(self._roots)
+            self._roots.append(root)
+        self._keys[raw] = root_id
+        self.bloom.add(pubkey_hex)
+        return True
+
+    def add(self, event: Dict, verify: bool = True) -> bool:
+        """
+        Index a lineage event. With verify=True the event must pass
+        verify_lineage against its own root tag and carry a valid NIP-01
+        id and event signature by its epoch key (nip01.verify_event).
+        """
+        if not isinstance(event, dict):
+            return False
+        pubkey_hex = event.get("pubkey")
+        root_hex, _, _ = _extract_lineage_tags(event)
+        if not isinstance(pubkey_hex, str) or not isinstance(root_hex, str):
+            return False
+        if verify and not (verify_lineage(root_hex, event) and verify_event(event)):
+            return False
+        return self.add_pubkey(pubkey_hex, root_hex)
+
+    def lookup(self, pubkey_hex: str) -> Optional[str]:
+        """
+        Return the root pubkey hex for an epoch pubkey, or None.
+        """
+        if not pubkey_hex.islower():
+            pubkey_hex = pubkey_hex.lower()
+        if pubkey_hex not in self.bloom:
+            return None
+        try:
+            raw = binascii.unhexlify(pubkey_hex)
+        except (binascii.Error, ValueError):
+            return None
+        root_id = self._keys.get(raw)
+        if root_id is None:
+            self.false_positives += 1
+            return None
+        return self._roots[root_id]
+
+    def __contains__(self, pubkey_hex: str) -> bool:
+        return self.lookup(pubkey_hex) is not None
+
+    @classmethod
+    def from_lineage_index(cls, index: LineageIndex, verify: bool = True, **kwargs) -> "EpochRootIndex":
+        """
+        Build from the chains of a LineageIndex. Their root signatures were
+        verified on the way in, but LineageIndex does not check event
+        signatures, so with verify=True events without a valid one by
+        their epoch key are left out.
+        """
+        reverse = cls(**kwargs)
+        for root in index.roots():
+            for event in index.chain(root):
+                if not verify or verify_event(event):
+                    reverse.add_pubkey(event["pubkey"], root)
+        return reverse
@@ -0,0 +1,281 @@
+# coldroot/server.py
+
+"""
+Long-running lineage verification service.
+
+Speaks newline-delimited JSON over a Unix socket (or localhost TCP): one
+request object per line, one response object per line, in order. Parsed
+root keys, verified signatures and the per-root lineage chains stay warm
+in memory between requests.
+
+Requests (an optional "id" is echoed back):
+
+    {"op": "verify", "event": {...}}            single event
+    {"op": "verify", "events": [{...}, ...]}    batch
+    {"op": "resolve", "root": "<hex>"}          current epoch for a root
+    {"op": "resolve", "roots": ["<hex>", ...]}  several roots
+    {"op": "stats"}
+    {"op": "snapshot"}                          save state (serve --snapshot)
+    {"op": "ping"}
+
+An optional "root" on verify requests pins the expected root; otherwise
+the root tag of each event is used. An optional "source" (e.g. the relay
+the events came from) is counted in the negative cache statistics. Valid events are added to the
+service's LineageIndex, so later resolve requests see them. An event whose
+signature checks out but which reuses an epoch pubkey or label already
+accepted for its root is reported invalid ("pubkey_reused" or
+"label_reused"); sending an accepted event again is still valid.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import stat
+from typing import Any, Dict, Optional
+
+from .cache import NegativeLineageCache, VerifiedLineageCache, root_keys
+from .chain import LineageIndex
+from .lineage import Rejection, _extract_lineage_tags, check_lineage
+
+# Largest request line accepted, which bounds batch size.
+MAX_LINE = 16 * 1024 * 1024
+# Events verified between yields to the event loop inside a batch.
+YIELD_EVERY = 256
+
+
+def _epoch_summary(event: Optional[Dict]) -> Optional[Dict[str, Any]]:
+    if event is None:
+        return None
+    _, _, label = _extract_lineage_tags(event)
+    return {"pubkey": event["pubkey"], "label": label, "created_at": event["created_at"]}
+
+
+class LineageService:
+    """
+    Request handling and warm state for the verification daemon.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 1 << 20,
+        index: Optional[LineageIndex] = None,
+        snapshot_path: Optional[str] = None,
+    ):
+        self.cache = VerifiedLineageCache(maxsize=cache_size)
+        # forged events re-broadcast across relays are rejected from here
+        self.negative_cache = NegativeLineageCache()
+        self.index = index if index is not None else LineageIndex(cache=self.cache)
+        self.snapshot_path = snapshot_path
+        self.requests = 0
+
+    def save_snapshot(self) -> int:
+        from .snapshot import save_snapshot
+
+        if self.snapshot_path is None:
+            raise ValueError("no snapshot path configured")
+        return save_snapshot(self.index, self.snapshot_path)
+
+    def verify_event(
+        self, event: Any, root: Optional[str] = None, source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if not isinstance(event, dict):
+            return {"valid": False, "reason": Rejection.INVALID_JSON}
+        if root is None:
+            root, _, _ = _extract_lineage_tags(event)
+            if not isinstance(root, str):
+                return {"valid": False, "reason": Rejection.MISSING_TAGS}
+
+        reason = check_lineage(
+            root, event, cache=self.cache, negative_cache=self.negative_cache, source=source
+        )
+        if reason is None:
+            reason = self._admit(event)
+        return {"valid": reason is None, "reason": reason}
+
+    def _admit(self, event: Dict) -> Optional[Rejection]:
+        """
+        Add a verified event to the index, or say why the index refused it.
+        An event already accepted (same epoch pubkey and label) is not an error.
+        """
+        if self.index.add(event, verify=False):
+            return None
+        if type(event.get("created_at")) is not int:
+            return Rejection.BAD_CREATED_AT
+        root_hex, _, label = _extract_lineage_tags(event)
+        chain = self.index.chain(root_hex)
+        pubkey_hex = event["pubkey"].lower()
+        if chain is not None and chain.has_pubkey(pubkey_hex):
+            for existing in chain:
+                if existing["pubkey"].lower() == pubkey_hex:
+                    if _extract_lineage_tags(existing)[2] == label:
+                        return None
+                    return Rejection.PUBKEY_REUSED
+        return Rejection.LABEL_REUSED
+
+    def resolve(self, root: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(root, str):
+            raise ValueError("root must be a hex string")
+        return _epoch_summary(self.index.current_epoch(root))
+
+    async def handle(self, request: Any) -> Dict[str, Any]:
+        """
+        Answer one decoded request object.
+        """
+        self.requests += 1
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+
+        op = request.get("op")
+        response: Dict[str, Any] = {"ok": True}
+        try:
+            if op == "verify":
+                root = request.get("root")
+                source = request.get("source")
+                if source is not None and not isinstance(source, str):
+                    raise ValueError("source must be a string")
+                if "events" in request:
+                    events = request["events"]
+                    if not isinstance(events, list):
+                        raise ValueError("events must be a list")
+                    results = []
+                    for i, event in enumerate(events):
+                        results.append(self.verify_event(event, root, source))
+                        if i % YIELD_EVERY == YIELD_EVERY - 1:
+                            await asyncio.sleep(0)
+                    response["results"] = results
+                else:
+                    response.update(self.verify_event(request.get("event"), root, source))
+            elif op == "resolve":
+                if "roots" in request:
+                    roots = request["roots"]
+                    if not isinstance(roots, list):
+                        raise ValueError("roots must be a list")
+                    response["epochs"] = {r: self.resolve(r) for r in roots}
+                else:
+                    response["epoch"] = self.resolve(request.get("root"))
+            elif op == "stats":
+                response["stats"] = {
+                    "requests": self.requests,
+                    "events": len(self.index),
+                    "root_keys": len(root_keys),
+                    "cache": self.cache.stats(),
+                    "negative_cache": self.negative_cache.stats(),
+                }
+            elif op == "snapshot":
+                response["watermark"] = self.save_snapshot()
+            elif op == "ping":
+                pass
+            else:
+                return {"ok": False, "error": f"unknown op: {op!r}"}
+        except ValueError as exc:
+            response = {"ok": False, "error": str(exc)}
+        except Exception as exc:
+            # a bug must cost one request, not the client's connection
+            response = {"ok": False, "error": f"internal error: {type(exc).__name__}"}
+
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # line longer than MAX_LINE; the stream can't be resynced
+                    writer.write(b'{"ok":false,"error":"request too large"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"ok": False, "error": "invalid JSON"}
+                else:
+                    response = await self.handle(request)
+                writer.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+
+def _is_socket(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+async def start_server(
+    service: LineageService,
+    path: Optional[str] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> asyncio.AbstractServer:
+    """
+    Start listening on a Unix socket path, or on host:port if no path is
+    given. The Unix socket is created owner-only (0600). A stale socket
+    left at path is replaced; any other file there raises FileExistsError.
+    """
+    if path is not None:
+        if _is_socket(path):
+            os.unlink(path)
+        elif os.path.lexists(path):
+            raise FileExistsError(f"{path} exists and is not a socket")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # bind under a restrictive umask so no other user can connect
+        # between bind and chmod
+        umask = os.umask(0o077)
+        try:
+            sock.bind(path)
+            os.chmod(path, 0o600)
+        except BaseException:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        return await asyncio.start_unix_server(service.handle_client, sock=sock, limit=MAX_LINE)
+    return await asyncio.start_server(
+        service.handle_client, host=host or "127.0.0.1", port=port or 0, limit=MAX_LINE
+    )
+
+
+def serve(
+    path: Optional[str] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    cache_size: int = 1 << 20,
+    snapshot: Optional[str] = None,
+) -> None:
+    """
+    Run the service until interrupted. With snapshot, verified state is
+    loaded from that file at startup (if it exists) and saved back to it
+    on shutdown.
+    """
+    index = None
+    if snapshot is not None and os.path.exists(snapshot):
+        from .snapshot import load_snapshot
+
+        index, _ = load_snapshot(snapshot)
+    service = LineageService(cache_size=cache_size, index=index, snapshot_path=snapshot)
+
+    async def main() -> None:
+        server = await start_server(service, path=path, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if path is not None and _is_socket(path):
+            os.unlink(path)
+        if snapshot is not None:
+            service.save_snapshot()
@@ -0,0 +1,268 @@
+# coldroot/shard.py
+
+"""
+Root-sharded lineage state across worker processes.
+
+Roots are assigned to workers by consistent hashing of the lowercase root
+pubkey hex on a ring with virtual nodes, so adding a worker moves only the
+roots that now hash to it, about 1/N of them. Each worker process owns a
+LineageIndex for its roots and verifies incoming events with
+verify_lineage. ShardedResolver is the coordinator: it routes events to
+the owning worker and fans bulk queries out to all workers at once.
+
+Workers talk to the coordinator over multiprocessing pipes, one request
+and one response at a time per worker.
+"""
+
+import bisect
+import hashlib
+import multiprocessing
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import VerifiedLineageCache
+from .chain import LineageIndex
+from .lineage import _extract_lineage_tags
+
+DEFAULT_VNODES = 128
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys to node names.
+
+    Each node is placed at vnodes pseudo-random points; a key belongs to the
+    first node point at or after its own hash. The hash is blake2b, so every
+    process computes the same placement.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = DEFAULT_VNODES):
+        if vnodes <= 0:
+            raise ValueError("vnodes must be positive")
+        self.vnodes = vnodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self.nodes: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> None:
+        if node in self.nodes:
+            raise ValueError(f"node {node!r} already on the ring")
+        self.nodes.append(node)
+        for i in range(self.vnodes):
+            point = _ring_hash(f"{node}#{i}")
+            j = bisect.bisect_left(self._points, point)
+            self._points.insert(j, point)
+            self._owners.insert(j, node)
+
+    def remove(self, node: str) -> None:
+        self.nodes.remove(node)
+        keep = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in keep]
+        self._owners = [o for _, o in keep]
+
+    def node_for(self, key: str) -> str:
+        if not self._points:
+            raise ValueError("hash ring is empty")
+        i = bisect.bisect_left(self._points, _ring_hash(key))
+        if i == len(self._points):
+            i = 0
+        return self._owners[i]
+
+
+def _summary(event: Optional[Dict]) -> Optional[Tuple[str, str, int]]:
+    if event is None:
+        return None
+    _, _, label = _extract_lineage_tags(event)
+    return event["pubkey"], label, event["created_at"]
+
+
+def _worker_main(conn, name: str, cache_size: int) -> None:
+    """
+    Worker process loop: serve requests from the coordinator until "stop".
+    """
+    index = LineageIndex(cache=VerifiedLineageCache(maxsize=cache_size))
+    while True:
+        try:
+            op, payload = conn.recv()
+        except EOFError:
+            break
+        try:
+            if op == "add":
+                result = [index.add(event) for event in payload]
+            elif op == "load":
+                # chains handed over from another worker, verified there
+                result = sum(index.add(event, verify=False) for event in payload)
+            elif op == "resolve":
+                result = {root: _summary(index.current_epoch(root)) for root in payload}
+            elif op == "rebalance":
+                nodes, vnodes = payload
+                ring = HashRing(nodes, vnodes)
+                moved = [root for root in index.roots() if ring.node_for(root) != name]
+                result = {root: list(index.pop(root)) for root in moved}
+            elif op == "stats":
+                result = {"roots": sum(1 for _ in index.roots()), "events": len(index)}
+            elif op == "stop":
+                conn.send(("ok", None))
+                break
+            else:
+                raise ValueError(f"unknown op {op!r}")
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        else:
+            conn.send(("ok", result))
+    conn.close()
+
+
+class ShardedResolver:
+    """
+    Coordinator for root-sharded lineage state in worker processes.
+
+    events are routed by their root tag; events without one are rejected
+    without reaching a worker. Queries for many roots are split by owner,
+    sent to every worker first and then collected, so workers answer in
+    parallel.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        vnodes: int = DEFAULT_VNODES,
+        cache_size: int = 65536,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self.cache_size = cache_size
+        self._ctx = mp_context or multiprocessing.get_context()
+        self.ring = HashRing(vnodes=vnodes)
+        self._workers: Dict[str, Tuple[multiprocessing.process.BaseProcess, object]] = {}
+        self._next_id = 0
+        try:
+            for _ in range(workers):
+                self._spawn()
+        except BaseException:
+            self.close()
+            raise
+
+    def _spawn(self) -> str:
+        name = f"worker-{self._next_id}"
+        self._next_id += 1
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker_main, args=(child, name, self.cache_size), name=f"coldroot-{name}", daemon=True
+        )
+        proc.start()
+        child.close()
+        self._workers[name] = (proc, parent)
+        self.ring.add(name)
+        return name
+
+    def __enter__(self) -> "ShardedResolver":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def workers(self) -> List[str]:
+        return list(self.ring.nodes)
+
+    def _fanout(self, requests: Dict[str, Tuple[str, object]]) -> Dict[str, object]:
+        for name, request in requests.items():
+            self._workers[name][1].send(request)
+        results = {}
+        errors = []
+        for name in requests:
+            status, value = self._workers[name][1].recv()
+            if status == "ok":
+                results[name] = value
+            else:
+                errors.append(f"{name}: {value}")
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        return results
+
+    def owner(self, root_pubkey_hex: str) -> str:
+        return self.ring.node_for(root_pubkey_hex.lower())
+
+    def add_events(self, events: Iterable[Dict]) -> List[bool]:
+        """
+        Verify and index events on their owning workers. Returns per-event
+        acceptance, in input order.
+        """
+        events = list(events)
+        results = [False] * len(events)
+        routed: Dict[str, List[int]] = {}
+        for i, event in enumerate(events):
+            if not isinstance(event, dict):
+                continue
+            root_hex, _, _ = _extract_lineage_tags(event)
+            if not isinstance(root_hex, str):
+                continue
+            routed.setdefault(self.owner(root_hex), []).append(i)
+
+        answers = self._fanout({name: ("add", [events[i] for i in idx]) for name, idx in routed.items()})
+        for name, idx in routed.items():
+            for i, ok in zip(idx, answers[name]):
+                results[i] = ok
+        return results
+
+    def add(self, event: Dict) -> bool:
+        return self.add_events([event])[0]
+
+    def resolve(self, roots: Sequence[str]) -> Dict[str, Tuple[str, str, int]]:
+        """
+        root -> (epoch pubkey, label, created_at) of the active epoch, as
+        resolve_current_epochs; roots without lineage are absent.
+        """
+        routed: Dict[str, List[str]] = {}
+        for root in roots:
+            routed.setdefault(self.owner(root), []).append(root.lower())
+        answers = self._fanout({name: ("resolve", batch) for name, batch in routed.items()})
+
+        resolved = {}
+        for root in roots:
+            found = answers[self.owner(root)].get(root.lower())
+            if found is not None:
+                resolved[root] = tuple(found)
+        return resolved
+
+    def current_epoch(self, root_pubkey_hex: str) -> Optional[Tuple[str, str, int]]:
+        return self.resolve([root_pubkey_hex]).get(root_pubkey_hex)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return self._fanout({name: ("stats", None) for name in self._workers})
+
+    def __len__(self) -> int:
+        return sum(s["events"] for s in self.stats().values())
+
+    def add_worker(self) -> int:
+        """
+        Start one more worker and hand it the roots that now hash to it.
+        Moved chains are not verified again. Returns the number of roots moved.
+        """
+        name = self._spawn()
+        others = [n for n in self._workers if n != name]
+        handed = self._fanout({n: ("rebalance", (self.ring.nodes, self.ring.vnodes)) for n in others})
+        events = [event for chains in handed.values() for chain in chains.values() for event in chain]
+        if events:
+            self._fanout({name: ("load", events)})
+        return sum(len(chains) for chains in handed.values())
+
+    def close(self) -> None:
+        for name, (proc, conn) in list(self._workers.items()):
+            try:
+                conn.send(("stop", None))
+                conn.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            conn.close()
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        self._workers.clear()
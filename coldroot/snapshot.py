@@ -0,0 +1,102 @@
+# coldroot/snapshot.py
+
+"""
+Snapshots of verified lineage state for warm restarts.
+
+A snapshot holds every accepted event of a LineageIndex, per root and in
+chain order, plus a watermark: the newest created_at the snapshot covers
+unless the caller supplies its own (e.g. a relay "since" cursor). The
+seen pubkeys and labels and the active epoch of each root follow from the
+chains, so they are rebuilt rather than stored.
+
+File layout (little endian):
+
+    magic "CRSN" | version u16 | reserved u16 | sha256 of payload (32) |
+    payload length u64 | payload
+
+The payload is zlib-compressed JSON. Files are written to a temp file and
+renamed into place, so a crash never leaves a partial snapshot behind.
+
+Loading trusts the snapshot and re-verifies nothing. Events delivered
+again after a restart are caught by the index's reuse checks before any
+signature check, so catching up costs time proportional to the new events.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from typing import Optional, Tuple
+
+from .cache import VerifiedLineageCache
+from .chain import LineageIndex
+
+MAGIC = b"CRSN"
+VERSION = 1
+HEADER = struct.Struct("<4sHH32sQ")
+
+
+def save_snapshot(index: LineageIndex, path: str, watermark: Optional[int] = None) -> int:
+    """
+    Atomically write index to path. Returns the watermark stored.
+    """
+    roots = {}
+    newest = 0
+    for root in index.roots():
+        events = list(index.chain(root))
+        roots[root] = events
+        if events:
+            newest = max(newest, events[-1]["created_at"])
+    if watermark is None:
+        watermark = newest
+
+    body = json.dumps(
+        {"watermark": watermark, "roots": roots}, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    payload = zlib.compress(body, 6)
+    header = HEADER.pack(MAGIC, VERSION, 0, hashlib.sha256(payload).digest(), len(payload))
+
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return watermark
+
+
+def load_snapshot(
+    path: str, cache: Optional[VerifiedLineageCache] = None
+) -> Tuple[LineageIndex, int]:
+    """
+    Rebuild a LineageIndex from a snapshot without re-verifying it.
+
+    Returns (index, watermark). Raises ValueError if the file is not a
+    snapshot, has an unsupported version or fails its content hash.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError("not a lineage snapshot")
+    magic, version, _, digest, length = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a lineage snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    payload = data[HEADER.size:]
+    if len(payload) != length or hashlib.sha256(payload).digest() != digest:
+        raise ValueError("snapshot is corrupt (content hash mismatch)")
+
+    state = json.loads(zlib.decompress(payload))
+    index = LineageIndex(cache=cache)
+    for events in state["roots"].values():
+        for event in events:
+            index.add(event, verify=False)
+    return index, state["watermark"]
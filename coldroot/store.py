@@ -0,0 +1,172 @@
+# coldroot/store.py
+
+"""
+Persistent lineage store on SQLite.
+
+Only verified events are written, so loading never re-checks signatures.
+Each event is one row keyed by (root, epoch pubkey), with a unique
+(root, label) constraint, so the reuse rules of SPEC.md sections 4.2 and
+4.3 hold on disk too. Lookups by root, epoch pubkey, label and created_at
+are all indexed. The database runs in WAL mode so readers don't block the
+writer, and inserts are batched into one transaction per batch.
+"""
+
+import json
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .cache import VerifiedLineageCache
+from .chain import LineageIndex
+from .lineage import _extract_lineage_tags, verify_lineage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lineage (
+    root TEXT NOT NULL,
+    pubkey TEXT NOT NULL,
+    label TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (root, pubkey),
+    UNIQUE (root, label)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS lineage_root_created ON lineage (root, created_at, pubkey);
+CREATE INDEX IF NOT EXISTS lineage_pubkey ON lineage (pubkey);
+CREATE INDEX IF NOT EXISTS lineage_label ON lineage (label);
+CREATE INDEX IF NOT EXISTS lineage_created ON lineage (created_at);
+"""
+
+_INSERT = "INSERT OR IGNORE INTO lineage (root, pubkey, label, created_at, event) VALUES (?, ?, ?, ?, ?)"
+
+
+def _row(event: Dict) -> Optional[tuple]:
+    if not isinstance(event, dict):
+        return None
+    pubkey_hex = event.get("pubkey")
+    created_at = event.get("created_at")
+    root_hex, _, label = _extract_lineage_tags(event)
+    if (
+        not isinstance(pubkey_hex, str)
+        or type(created_at) is not int
+        or not isinstance(root_hex, str)
+        or not isinstance(label, str)
+    ):
+        return None
+    event_json = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+    return (root_hex.lower(), pubkey_hex.lower(), label, created_at, event_json)
+
+
+class LineageStore:
+    """
+    SQLite-backed store of verified lineage events.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "LineageStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM lineage").fetchone()[0]
+
+    def add_events(
+        self,
+        events: Iterable[Dict],
+        verify: bool = True,
+        cache: Optional[VerifiedLineageCache] = None,
+    ) -> int:
+        """
+        Store lineage events, verifying each against its own root tag first
+        unless verify is False. Malformed or invalid events, and events that
+        reuse an epoch pubkey or label already stored for their root, are
+        skipped. Returns the number of rows inserted.
+        """
+        inserted = 0
+        batch: List[tuple] = []
+        for event in events:
+            row = _row(event)
+            if row is None:
+                continue
+            if verify and not verify_lineage(row[0], event, cache=cache):
+                continue
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                inserted += self._insert(batch)
+                batch = []
+        if batch:
+            inserted += self._insert(batch)
+        return inserted
+
+    def add(self, event: Dict, verify: bool = True) -> bool:
+        return self.add_events([event], verify=verify) == 1
+
+    def _insert(self, rows: List[tuple]) -> int:
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(_INSERT, rows)
+        return self.conn.total_changes - before
+
+    def current_epoch(self, root_pubkey_hex: str) -> Optional[Dict]:
+        """
+        Return the active lineage event for a root (SPEC.md section 5), or None.
+        """
+        row = self.conn.execute(
+            "SELECT event FROM lineage WHERE root = ? ORDER BY created_at DESC, pubkey DESC LIMIT 1",
+            (root_pubkey_hex.lower(),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def history(self, root_pubkey_hex: str) -> List[Dict]:
+        """
+        All stored lineage events for a root, oldest first.
+        """
+        rows = self.conn.execute(
+            "SELECT event FROM lineage WHERE root = ? ORDER BY created_at, pubkey",
+            (root_pubkey_hex.lower(),),
+        )
+        return [json.loads(r[0]) for r in rows]
+
+    def root_of(self, epoch_pubkey_hex: str) -> Optional[str]:
+        """
+        Return the root that authorized an epoch pubkey, or None.
+        """
+        row = self.conn.execute(
+            "SELECT root FROM lineage WHERE pubkey = ? LIMIT 1", (epoch_pubkey_hex.lower(),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def by_label(self, label: str) -> List[Dict]:
+        rows = self.conn.execute("SELECT event FROM lineage WHERE label = ?", (label,))
+        return [json.loads(r[0]) for r in rows]
+
+    def since(self, created_at: int) -> Iterator[Dict]:
+        """
+        Events with created_at >= the given timestamp, oldest first.
+        """
+        rows = self.conn.execute(
+            "SELECT event FROM lineage WHERE created_at >= ? ORDER BY created_at", (created_at,)
+        )
+        return (json.loads(r[0]) for r in rows)
+
+    def roots(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT root FROM lineage")]
+
+    def load_index(self, cache: Optional[VerifiedLineageCache] = None) -> LineageIndex:
+        """
+        Build a LineageIndex from all stored rows without re-verifying them.
+        """
+        index = LineageIndex(cache=cache)
+        for (event_json,) in self.conn.execute("SELECT event FROM lineage"):
+            index.add(json.loads(event_json), verify=False)
+        return index
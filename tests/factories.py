@@ -0,0 +1,51 @@
+"""
+Lineage event factories shared by the test modules.
+
+Test modules put the repo root on sys.path before importing this module,
+as they do for coldroot itself.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from coldroot.core import derive_epoch_key, signing_key_from_seed_hex
+from coldroot.lineage import make_lineage_event
+from coldroot.nip01 import sign_event
+
+SEED_HEX = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+OTHER_SEED_HEX = "ff" * 32
+
+
+def make_event(
+    label: str,
+    created_at: int = 0,
+    seed_hex: str = SEED_HEX,
+    epoch_label: Optional[str] = None,
+    signed: bool = False,
+) -> Dict:
+    """
+    Lineage event for label under the root of seed_hex. The epoch key is
+    derived from epoch_label (default: label). With signed=True the NIP-01
+    id and sig are filled in by the epoch key.
+    """
+    root_sk = signing_key_from_seed_hex(seed_hex)
+    epoch_sk, epoch_vk = derive_epoch_key(seed_hex, epoch_label or label)
+    event = make_lineage_event(root_sk, epoch_vk, label, created_at=created_at)
+    return sign_event(event, epoch_sk) if signed else event
+
+
+def make_events(labels: Iterable[str], seed_hex: str = SEED_HEX, created_at: int = 0) -> List[Dict]:
+    """
+    One event per label, created_at counting up from created_at.
+    """
+    return [make_event(label, created_at + i, seed_hex) for i, label in enumerate(labels)]
+
+
+def numbered_events(count: int, seed_hex: str = SEED_HEX) -> List[Dict]:
+    """
+    Events labelled "0", "1", ... with created_at equal to the label.
+    """
+    return make_events([str(i) for i in range(count)], seed_hex)
+
+
+def root_of(event: Dict) -> str:
+    return next(t[1] for t in event["tags"] if t[0] == "root")
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot import aio
+from coldroot.cache import NegativeLineageCache, VerifiedLineageCache
+from coldroot.core import derive_epoch_key
+from coldroot.lineage import verify_lineage_batch
+from factories import SEED_HEX, numbered_events
+
+
+@pytest.fixture(autouse=True)
+def default_pool():
+    yield
+    aio.configure()
+
+
+def test_verify_with_caches_on_the_loop(monkeypatch):
+    good, other = numbered_events(2)
+    root = good["tags"][0][1]
+    forged = dict(other, tags=[other["tags"][0], good["tags"][1], other["tags"][2]])
+    cache, negative = VerifiedLineageCache(), NegativeLineageCache()
+
+    async def scenario():
+        kw = dict(cache=cache, negative_cache=negative, source="relay")
+        first = [await aio.averify_lineage(root, e, **kw) for e in (good, forged)]
+        reason = await aio.acheck_lineage(root, dict(good, pubkey="ab"), **kw)
+        monkeypatch.setattr(aio, "_run", None)  # cache hits must not reach the pool
+        again = [await aio.averify_lineage(root, e, **kw) for e in (good, forged)]
+        return first, reason, again
+
+    assert asyncio.run(scenario()) == ([True, False], "bad_length", [True, False])
+    assert negative.sources["relay"] == {"rejected": 1, "dropped": 1}
+
+
+def test_many_and_derive_on_a_process_pool():
+    events = numbered_events(10)
+    events[3] = dict(events[3], kind=1)
+    root = events[0]["tags"][0][1]
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        aio.configure(executor=pool)
+
+        async def scenario():
+            many = await aio.averify_lineage_many(events, root, chunksize=3)
+            keys = await aio.aderive_epoch_key(SEED_HEX, "2025-Q1")
+            return many, keys
+
+        many, (sk, vk) = asyncio.run(scenario())
+
+    assert many == verify_lineage_batch(events, root)
+    assert bytes(vk) == bytes(derive_epoch_key(SEED_HEX, "2025-Q1")[1])
+
+
+def test_concurrency_limit_and_cancellation(monkeypatch):
+    running = []
+    peak = [0]
+    started = []
+    lock = threading.Lock()
+
+    def slow_check(root, event):
+        with lock:
+            running.append(1)
+            started.append(event)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+        return None
+
+    monkeypatch.setattr(aio, "check_lineage", slow_check)
+    event = numbered_events(1)[0]
+    root = event["tags"][0][1]
+    aio.configure(executor=ThreadPoolExecutor(max_workers=4), max_concurrency=2)
+
+    async def scenario():
+        tasks = [asyncio.create_task(aio.averify_lineage(root, event)) for _ in range(6)]
+        await asyncio.sleep(0.01)
+        for task in tasks[2:]:
+            task.cancel()
+        done = await asyncio.gather(*tasks, return_exceptions=True)
+        return done
+
+    done = asyncio.run(scenario())
+    assert done[:2] == [True, True]
+    assert all(isinstance(d, asyncio.CancelledError) for d in done[2:])
+    assert peak[0] <= 2
+    assert len(started) == 2
+
+
+def test_event_loop_stays_responsive():
+    events = numbered_events(1) * 400
+    root = events[0]["tags"][0][1]
+
+    async def scenario():
+        ticks = 0
+        work = asyncio.create_task(aio.averify_lineage_many(events, root, chunksize=50))
+        while not work.done():
+            ticks += 1
+            await asyncio.sleep(0.001)
+        return ticks, await work
+
+    ticks, results = asyncio.run(scenario())
+    assert results == [True] * 400
+    assert ticks > 3
@@ -0,0 +1,106 @@
+import io
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot import archive
+from coldroot.archive import HEADER, RECORD_SIZE, LineageArchive, write_archive
+from coldroot.lineage import verify_lineage
+from factories import make_event
+
+
+def test_round_trip_and_verify(tmp_path):
+    events = [make_event(label, i) for i, label in enumerate(["2025-Q1", "época-2", ""])]
+    forged = make_event("forged", 99)
+    forged["tags"][1] = events[0]["tags"][1]
+    path = tmp_path / "lineage.crla"
+    with open(path, "wb") as fp:
+        assert write_archive(fp, events + [forged]) == 4
+
+    size = path.stat().st_size
+    labels = sum(len(e["tags"][2][1].encode()) for e in events + [forged])
+    assert size == HEADER.size + 4 * RECORD_SIZE + labels
+
+    with LineageArchive(str(path)) as archive:
+        assert len(archive) == 4
+        assert list(archive)[:3] == events
+        root = events[0]["tags"][0][1]
+        assert all(verify_lineage(root, e) for e in list(archive)[:3])
+        assert archive.verify() == bytearray([1, 1, 1, 0])
+        root_pub, epoch_pub, sig, created_at, label = archive.record(1)
+        assert isinstance(epoch_pub, memoryview)
+        assert epoch_pub.hex() == events[1]["pubkey"]
+        assert (created_at, label) == (1, "época-2")
+        del root_pub, epoch_pub, sig
+        try:
+            archive.record(4)
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("record index past the end accepted")
+
+
+def test_rejects_bad_input(tmp_path):
+    event = make_event("2025-Q1", 1)
+    try:
+        write_archive(io.BytesIO(), [dict(event, kind=1)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("wrote a kind 1 event")
+    try:
+        write_archive(io.BytesIO(), [dict(event, created_at="1")])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("wrote a string created_at")
+
+    path = tmp_path / "bad.crla"
+    path.write_bytes(b"JUNK" + bytes(40))
+    try:
+        LineageArchive(str(path))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("opened a file without the archive magic")
+    with open(path, "wb") as fp:
+        write_archive(fp, [event])
+    path.write_bytes(path.read_bytes()[:-10])
+    try:
+        LineageArchive(str(path))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("opened a truncated archive")
+
+
+def test_streams_records_and_spills_labels(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "HEAP_SPOOL_SIZE", 16)
+    events = [make_event(f"label-{i:04d}", i) for i in range(20)]
+    path = tmp_path / "lineage.crla"
+    with open(path, "wb") as fp:
+        assert write_archive(fp, iter(events)) == 20
+    with LineageArchive(str(path)) as view:
+        assert list(view) == events
+        assert view.verify() == bytearray([1] * 20)
+
+    def interrupted():
+        yield events[0]
+        raise KeyboardInterrupt
+
+    with open(path, "wb") as fp:
+        try:
+            write_archive(fp, interrupted())
+        except KeyboardInterrupt:
+            pass
+        else:
+            raise AssertionError("interrupt swallowed")
+    try:
+        LineageArchive(str(path))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("opened an interrupted archive")
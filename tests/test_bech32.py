@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+import random
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot import bech32
+from coldroot.core import bech32_encode, convert_bits, nostr_bech32_encode
+
+# NIP-19 examples
+NPUB_HEX = "7e7e9c42a91bfef19fa929e5fda1b72e0ebc1a4c1141673e2794234d86addf4e"
+NPUB = "npub10elfcs4fr0l0r8af98jlmgdh9c8tcxjvz9qkw038js35mp4dma8qzvjptg"
+NSEC_HEX = "67dea2ed018072d675f5415ecfaed7d2597555e202d85b3d65ea4e58d2d92ffa"
+NSEC = "nsec1vl029mgpspedva04g90vltkh6fvh240zqtv9k0t9af8935ke9laqsnlfe5"
+
+
+def reference_encode(hrp, data):
+    return bech32_encode(hrp, convert_bits(data, 8, 5, True))
+
+
+def test_matches_reference_encoder():
+    rng = random.Random(1)
+    for hrp in ("npub", "nsec", "note"):
+        for size in (1, 2, 5, 20, 32, 33, 64):
+            data = bytes(rng.getrandbits(8) for _ in range(size))
+            assert bech32.encode(hrp, data) == reference_encode(hrp, data)
+            assert nostr_bech32_encode(hrp, data) == reference_encode(hrp, data)
+
+
+def test_nip19_vectors_round_trip():
+    assert bech32.npubs_from_pubkeys([NPUB_HEX, bytes.fromhex(NPUB_HEX)]) == [NPUB, NPUB]
+    assert bech32.decode_npub(NPUB).hex() == NPUB_HEX
+    assert bech32.decode_npub(NPUB.upper()).hex() == NPUB_HEX
+    assert bech32.decode_nsec(NSEC).hex() == NSEC_HEX
+    assert bech32.encode("nsec", bytes.fromhex(NSEC_HEX)) == NSEC
+
+    keys = [os.urandom(32) for _ in range(50)]
+    assert bech32.pubkeys_from_npubs(bech32.npubs_from_pubkeys(keys)) == keys
+
+
+def test_decode_rejects_bad_input():
+    flipped = NPUB[:-1] + ("q" if NPUB[-1] != "q" else "p")
+    bad = [
+        flipped,                      # checksum
+        NPUB[:10] + NPUB[10:].upper(),  # mixed case
+        NPUB.replace("0", "b", 1),    # 'b' is not in the charset
+        "npub1qqqqqq",                # too short for 32 bytes
+    ]
+    for s in bad:
+        try:
+            bech32.decode_npub(s)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"accepted {s!r}")
+
+    try:
+        bech32.decode_npub(NSEC)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("nsec accepted as npub")
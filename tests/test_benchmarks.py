@@ -0,0 +1,26 @@
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_spec = importlib.util.spec_from_file_location("coldroot_benchmarks", ROOT / "benchmarks" / "run.py")
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def test_every_case_runs_at_smallest_scale():
+    data = bench.run_suite(list(bench.CASES), [1, 3], memory=False)
+    assert len(data["results"]) == 2 * len(bench.CASES)
+    for r in data["results"]:
+        assert r["ops_per_sec"] > 0
+        assert r["p50_us"] <= r["p99_us"] <= r["max_us"]
+
+
+def test_compare_flags_only_large_regressions():
+    base = {"results": [{"name": "x", "scale": 1000, "ops_per_sec": 100.0},
+                        {"name": "y", "scale": 1, "ops_per_sec": 100.0}]}
+    new = {"results": [{"name": "x", "scale": 1000, "ops_per_sec": 80.0},
+                       {"name": "y", "scale": 1, "ops_per_sec": 10.0}]}
+
+    assert len(bench.compare(base, new, threshold=0.10)) == 1
+    assert bench.compare(base, new, threshold=0.25) == []
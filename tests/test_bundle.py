@@ -0,0 +1,84 @@
+import io
+import json
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import cold_root_identity
+from coldroot.bundle import expand_label_range, iter_lineage_bundle, write_lineage_bundle
+from coldroot.lineage import verify_lineage
+
+VECTORS_PATH = ROOT / "tests" / "vectors" / "cold_root_identity.v1.json"
+
+
+def load_vectors():
+    with VECTORS_PATH.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_expand_label_range():
+    assert list(expand_label_range("2025-Q3..2026-Q2")) == ["2025-Q3", "2025-Q4", "2026-Q1", "2026-Q2"]
+    assert list(expand_label_range("8..11")) == ["8", "9", "10", "11"]
+    for bad in ("2025-Q1", "2025-Q5..2026-Q1", "a..b"):
+        try:
+            list(expand_label_range(bad))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"accepted {bad!r}")
+
+
+def test_bundle_matches_reference_vectors():
+    data = load_vectors()
+    root = data["root"]
+    expected = data["epochs"][0]["lineage_event"]
+
+    buf = io.StringIO()
+    count = write_lineage_bundle(buf, iter_lineage_bundle(root["seed_hex"], expand_label_range("2025-Q1..2025-Q4")))
+    events = [json.loads(line) for line in buf.getvalue().splitlines()]
+
+    assert count == 4
+    for field in ["kind", "created_at", "content", "tags", "pubkey"]:
+        assert events[0][field] == expected[field]
+    assert all(verify_lineage(root["pk_hex"], e) for e in events)
+    assert len({e["pubkey"] for e in events}) == 4
+
+
+def test_bundle_created_at_base_and_label_reuse():
+    seed_hex = "11" * 32
+    events = list(iter_lineage_bundle(seed_hex, ["a", "b"], created_at_base=1000))
+    assert [e["created_at"] for e in events] == [1000, 1001]
+
+    try:
+        list(iter_lineage_bundle(seed_hex, ["a", "b", "a"], created_at_base=0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("label reuse accepted")
+
+
+def test_derive_bundle_leaves_no_temp_file_on_failure(tmp_path, monkeypatch):
+    out = tmp_path / "bundle.ndjson"
+
+    def fail_midway(f, events):
+        f.write(json.dumps(next(events)) + "\n")
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(cold_root_identity, "write_lineage_bundle", fail_midway)
+    args = cold_root_identity.build_parser().parse_args(
+        ["derive-bundle", "--root-seed-hex", "11" * 32, "--labels", "2026-Q1,2026-Q2", "--out", str(out)]
+    )
+    try:
+        args.func(args)
+    except OSError:
+        pass
+    else:
+        raise AssertionError("write error swallowed")
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.undo()
+    args.func(args)
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle.ndjson"]
@@ -0,0 +1,84 @@
+import copy
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.chain import LineageIndex
+from factories import make_event
+
+
+def test_current_epoch_is_newest_regardless_of_order():
+    index = LineageIndex()
+    q1 = make_event("2025-Q1", 100)
+    q2 = make_event("2025-Q2", 200)
+    q3 = make_event("2025-Q3", 300)
+
+    for e in (q2, q3, q1):
+        assert index.add(e)
+
+    root = q1["tags"][0][1]
+    assert index.current_epoch(root) is q3
+    assert [e["pubkey"] for e in index.chain(root)] == [q1["pubkey"], q2["pubkey"], q3["pubkey"]]
+    assert len(index) == 3
+    assert root.upper() in index
+
+
+def test_rejects_reused_pubkey_and_label():
+    index = LineageIndex()
+    q1 = make_event("2025-Q1", 100)
+    assert index.add(q1)
+
+    # same event re-delivered by another relay
+    assert not index.add(copy.deepcopy(q1))
+    # same epoch pubkey under a new label (SPEC 4.2)
+    assert not index.add(make_event("2025-Q9", 500, epoch_label="2025-Q1"))
+    # same label bound to another epoch pubkey (SPEC 4.3)
+    assert not index.add(make_event("2025-Q1", 600, epoch_label="other"))
+
+    assert len(index) == 1
+    assert index.current_epoch(q1["tags"][0][1]) is q1
+
+
+def test_rejects_invalid_and_malformed_events():
+    index = LineageIndex()
+    forged = make_event("2025-Q1", 100)
+    forged["pubkey"] = make_event("2025-Q2", 100)["pubkey"]
+
+    assert not index.add(forged)
+    assert not index.add({"kind": 30001, "tags": []})
+    assert not index.add(dict(make_event("2025-Q3", 100), created_at="100"))
+    assert len(index) == 0
+    assert index.current_epoch(forged["tags"][0][1]) is None
+
+
+def test_resolve_current_epochs_verifies_each_event_once(monkeypatch):
+    import coldroot.chain as chain_mod
+
+    calls = []
+    real_verify = chain_mod.verify_lineage
+
+    def counting_verify(root, event, cache=None):
+        calls.append(event["pubkey"])
+        return real_verify(root, event, cache=cache)
+
+    monkeypatch.setattr(chain_mod, "verify_lineage", counting_verify)
+
+    other_seed = "ff" * 32
+    a1, a2 = make_event("a1", 100), make_event("a2", 200)
+    b1 = make_event("b1", 50, seed_hex=other_seed)
+    c1 = make_event("c1", 10, seed_hex="22" * 32)
+    forged = dict(make_event("a3", 300), pubkey=make_event("x", 0)["pubkey"])
+    root_a, root_b = a1["tags"][0][1], b1["tags"][0][1]
+
+    stream = [a2, forged, b1, a1, c1] * 3
+    resolved = chain_mod.resolve_current_epochs([root_a.upper(), root_b, "00" * 32], stream)
+
+    assert resolved == {
+        root_a.upper(): (a2["pubkey"], "a2", 200),
+        root_b: (b1["pubkey"], "b1", 50),
+    }
+    # a2, forged, b1, a1 once each; c1's root was not requested
+    assert sorted(calls) == sorted([a2["pubkey"], forged["pubkey"], b1["pubkey"], a1["pubkey"]])
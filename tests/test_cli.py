@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE = ROOT / "examples" / "lineage_2026Q1.json"
+
+
+def run_cli(*args, stdin=""):
+    return subprocess.run(
+        [sys.executable, "-m", "coldroot.cli", *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+
+
+def test_verify_stream_reports_each_event():
+    event = json.loads(EXAMPLE.read_text())
+    forged = dict(event, pubkey="00" * 32)
+    lines = [json.dumps(event), "", "{not json", json.dumps(forged)]
+
+    proc = run_cli("verify", "--stream", stdin="\n".join(lines) + "\n")
+    results = [json.loads(l) for l in proc.stdout.splitlines()]
+
+    assert proc.returncode == 1
+    assert [r["valid"] for r in results] == [True, False, False]
+    assert results[0]["pubkey"] == event["pubkey"]
+    assert results[1]["reason"] == "invalid_json"
+    assert results[2]["reason"] == "bad_signature"
+
+
+def test_verify_stream_from_file(tmp_path):
+    path = tmp_path / "events.ndjson"
+    path.write_text(EXAMPLE.read_text().replace("\n", "") + "\n")
+
+    proc = run_cli("verify", "--stream", str(path))
+
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["valid"] is True
+
+
+def test_verify_stream_with_jobs_matches_single_process():
+    event = json.loads(EXAMPLE.read_text())
+    forged = dict(event, pubkey="00" * 32)
+    lines = "\n".join(json.dumps(e) for e in [event, forged, dict(event, kind=1)] * 3) + "\n"
+
+    single = run_cli("verify", "--stream", stdin=lines)
+    multi = run_cli("verify", "--stream", "--jobs", "2", "--chunksize", "2", stdin=lines)
+
+    assert multi.returncode == single.returncode == 1
+    assert multi.stdout == single.stdout
+
+
+def test_verify_stream_reports_malformed_tags_and_continues(tmp_path):
+    event = json.loads(EXAMPLE.read_text())
+    malformed = [{"kind": 30001, "tags": None}, dict(event, tags=5), dict(event, tags=[None, ["root"]])]
+    lines = "\n".join(json.dumps(e) for e in malformed + [event]) + "\n"
+
+    for extra in ([], ["--jobs", "2", "--chunksize", "1"]):
+        proc = run_cli("verify", "--stream", *extra, stdin=lines)
+        results = [json.loads(l) for l in proc.stdout.splitlines()]
+
+        assert proc.returncode == 1
+        assert "Traceback" not in proc.stderr
+        assert [r["reason"] for r in results] == ["missing_tags"] * 3 + [None]
+        assert results[-1]["valid"] is True
+
+    path = tmp_path / "lineage.json"
+    path.write_text(json.dumps(malformed[0]))
+    proc = run_cli("verify", str(path))
+    assert proc.returncode == 1
+    assert "missing root tag" in proc.stderr
+
+
+def test_verify_stream_metrics_count_every_line_with_and_without_jobs(tmp_path):
+    event = json.loads(EXAMPLE.read_text())
+    mixed = [event, dict(event, pubkey="00" * 32), dict(event, kind=1), {"kind": 30001, "tags": None}]
+    lines = "\n".join(json.dumps(e) for e in mixed * 2) + "\n{not json\n"
+
+    exports = []
+    for extra in ([], ["--jobs", "2", "--chunksize", "2"]):
+        out = tmp_path / f"metrics{len(exports)}.prom"
+        run_cli("verify", "--stream", *extra, "--metrics-out", str(out), stdin=lines)
+        exports.append([l for l in out.read_text().splitlines() if l.startswith("coldroot_lineage_")])
+
+    assert exports[0] == exports[1]
+    assert 'coldroot_lineage_checks_total{result="valid"} 2' in exports[0]
+    assert 'coldroot_lineage_checks_total{result="invalid"} 7' in exports[0]
+    assert 'coldroot_lineage_rejections_total{reason="bad_signature"} 2' in exports[0]
+    assert 'coldroot_lineage_rejections_total{reason="wrong_kind"} 2' in exports[0]
+    assert 'coldroot_lineage_rejections_total{reason="missing_tags"} 2' in exports[0]
+    assert 'coldroot_lineage_rejections_total{reason="invalid_json"} 1' in exports[0]
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.core import RootDeriver, derive_epoch_key, hkdf_sha256
+
+VECTORS_PATH = ROOT / "tests" / "vectors" / "cold_root_identity.v1.json"
+
+
+def load_vectors():
+    with VECTORS_PATH.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_root_deriver_matches_vectors():
+    data = load_vectors()
+    deriver = RootDeriver.from_hex(data["root"]["seed_hex"])
+
+    for epoch in data["epochs"]:
+        sk, vk = deriver.derive(epoch["label"])
+        assert sk.encode().hex() == epoch["sk_hex"]
+        assert vk.encode().hex() == epoch["pk_hex"]
+
+
+def test_root_deriver_matches_hkdf_over_label_range():
+    seed = bytes(range(32))
+    deriver = RootDeriver(seed)
+
+    for label in ["", "0", "2025-Q1", "2025Q1", "compromise-001", "épоch-ü"] + [str(i) for i in range(200)]:
+        expected = hkdf_sha256(seed, b"nostr-cold-root", b"epoch:" + label.encode("utf-8"), 32)
+        assert deriver.derive_seed(label) == expected
+        assert derive_epoch_key(seed.hex(), label)[0].encode() == expected
+
+
+def test_root_deriver_rejects_bad_seed():
+    for seed in (b"", bytes(31), bytes(33)):
+        try:
+            RootDeriver(seed)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("bad seed length accepted")
@@ -0,0 +1,81 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.cache import VerifiedLineageCache
+from coldroot.event import LineageEvent
+from coldroot.lineage import check_lineage, verify_lineage, verify_lineage_batch
+from coldroot.parallel import verify_lineage_parallel
+from factories import make_event
+
+
+def test_round_trip():
+    event = make_event("2025-Q1", 100)
+    compact = LineageEvent.from_dict(event)
+    assert compact.root.hex() == event["tags"][0][1]
+    assert len(compact.sig) == 64
+    assert compact.to_dict() == event
+    assert LineageEvent.from_dict(compact.to_dict()) == compact
+    assert not hasattr(compact, "__dict__")
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda e: e.pop("pubkey"),
+    lambda e: e.update(tags=e["tags"][:2]),
+    lambda e: e.update(created_at="100"),
+    lambda e: e.update(pubkey="zz" * 32),
+    lambda e: e.update(pubkey="ab" * 31),
+    lambda e: e["tags"].__setitem__(1, ["sig", "ab" * 63]),
+])
+def test_from_dict_rejects_malformed(mutate):
+    event = make_event("2025-Q1", 100)
+    mutate(event)
+    try:
+        LineageEvent.from_dict(event)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(f"accepted {event!r}")
+
+
+@pytest.mark.parametrize("event", [
+    ["x"],
+    None,
+    {"kind": 30001, "tags": None},
+    {"kind": 30001, "tags": 5},
+    {"kind": 30001, "tags": [None, ["root"], "sig"]},
+])
+def test_from_dict_rejects_non_event_input(event):
+    try:
+        LineageEvent.from_dict(event)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(f"accepted {event!r}")
+
+
+def test_verify_functions_accept_lineage_event():
+    good = make_event("2025-Q1", 100)
+    other = make_event("2025-Q2", 200)
+    root = good["tags"][0][1]
+    forged = dict(other, tags=[other["tags"][0], good["tags"][1], other["tags"][2]])
+    compact = [LineageEvent.from_dict(e) for e in (good, forged)]
+
+    assert verify_lineage(root, compact[0])
+    assert check_lineage(root, compact[1]) == "bad_signature"
+    assert check_lineage("00" * 32, compact[0]) == "root_mismatch"
+    wrong_kind = LineageEvent.from_dict(dict(good, kind=1))
+    assert check_lineage(root, wrong_kind) == "wrong_kind"
+    assert verify_lineage_batch(compact) == [True, False]
+    assert verify_lineage_parallel(compact, jobs=1) == [True, False]
+
+    # both forms share cache entries
+    cache = VerifiedLineageCache()
+    assert verify_lineage(root, compact[0], cache=cache)
+    assert verify_lineage(root.upper(), good, cache=cache)
+    assert cache.stats()["hits"] == 1
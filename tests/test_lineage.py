@@ -0,0 +1,263 @@
+import copy
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.cache import NegativeLineageCache, RootKeyCache, VerifiedLineageCache, root_keys
+from coldroot import lineage
+from coldroot.lineage import (
+    Rejection,
+    check_lineage,
+    prevalidate_lineage,
+    verify_lineage,
+    verify_lineage_batch,
+)
+from factories import OTHER_SEED_HEX, SEED_HEX, make_events, root_of
+
+
+def test_batch_matches_single_verification():
+    events = make_events(["2025-Q1", "2025-Q2"]) + make_events(["0", "1"], OTHER_SEED_HEX)
+
+    forged = copy.deepcopy(events[0])
+    forged["pubkey"] = events[1]["pubkey"]
+    wrong_kind = copy.deepcopy(events[2])
+    wrong_kind["kind"] = 1
+    short_sig = copy.deepcopy(events[3])
+    short_sig["tags"][1][1] = "00" * 10
+    events += [forged, wrong_kind, short_sig, {"kind": 30001}]
+
+    results = verify_lineage_batch(events)
+
+    assert results == [True, True, True, True, False, False, False, False]
+    for event, ok in zip(events[:7], results):
+        assert verify_lineage(root_of(event), event) == ok
+
+
+def test_batch_expected_roots():
+    events = make_events(["a", "b"]) + make_events(["c"], OTHER_SEED_HEX)
+    root = root_of(events[0])
+
+    assert verify_lineage_batch(events, expected_roots=root) == [True, True, False]
+    assert verify_lineage_batch(events, expected_roots=[None, root, root]) == [True, True, False]
+
+
+def test_large_batch_threads_match_inline(monkeypatch):
+    events = make_events([str(i) for i in range(lineage.BATCH_THREAD_MIN * 2)])
+    events[5] = dict(events[5], pubkey=events[6]["pubkey"])
+    events[9] = dict(events[9], kind=1)
+    root = root_of(events[0])
+
+    inline = verify_lineage_batch(events, root, jobs=1)
+    assert inline == [i not in (5, 9) for i in range(len(events))]
+
+    from coldroot import parallel
+
+    chunks = []
+    verify_packed = parallel.verify_packed
+    monkeypatch.setattr(parallel, "verify_packed", lambda chunk: chunks.append(chunk) or verify_packed(chunk))
+    assert verify_lineage_batch(events, root, jobs=4) == inline
+    assert len(chunks) == 4
+
+    # small batches stay in the calling thread
+    chunks.clear()
+    small = lineage.BATCH_THREAD_MIN - 1
+    assert verify_lineage_batch(events[:small], root, jobs=4) == inline[:small]
+    assert chunks == []
+
+
+def test_cache_hits_and_lru_eviction():
+    events = make_events(["a", "b", "c"])
+    root = root_of(events[0])
+    cache = VerifiedLineageCache(maxsize=2)
+
+    assert all(verify_lineage(root, e, cache=cache) for e in events)
+    assert len(cache) == 2
+    assert cache.stats()["misses"] == 3
+
+    # "a" was evicted, "c" is still warm
+    assert verify_lineage(root, events[2], cache=cache)
+    assert verify_lineage(root, events[0], cache=cache)
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+
+def test_cache_never_stores_failures():
+    event = make_events(["a"])[0]
+    root = root_of(event)
+    forged = copy.deepcopy(event)
+    forged["pubkey"] = make_events(["b"])[0]["pubkey"]
+    cache = VerifiedLineageCache()
+
+    assert not verify_lineage(root, forged, cache=cache)
+    assert not verify_lineage(root, forged, cache=cache)
+    assert len(cache) == 0
+
+    # a cached success does not leak to a different expected root
+    assert verify_lineage(root, event, cache=cache)
+    assert not verify_lineage("00" * 32, event, cache=cache)
+
+
+def test_cache_invalidate():
+    events = make_events(["a"]) + make_events(["b"], OTHER_SEED_HEX)
+    cache = VerifiedLineageCache()
+    for e in events:
+        verify_lineage(root_of(e), e, cache=cache)
+
+    assert cache.invalidate(root_of(events[0]).upper()) == 1
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_root_key_registry_reuses_parsed_keys():
+    event = make_events(["a"])[0]
+    root = root_of(event)
+    root_keys.clear()
+
+    assert verify_lineage(root, event)
+    vk = root_keys.get(root.upper())
+    assert vk is root_keys.get(root)
+    assert bytes(vk).hex() == root
+    assert len(root_keys) == 1
+
+
+def test_root_key_registry_is_bounded():
+    registry = RootKeyCache(maxsize=2)
+    roots = [root_of(make_events(["a"], s)[0]) for s in (SEED_HEX, OTHER_SEED_HEX, "11" * 32)]
+    for r in roots:
+        registry.get(r)
+
+    assert len(registry) == 2
+    assert not registry.evict(roots[0])
+    assert registry.evict(roots[2])
+
+    for bad in ("zz" * 32, "00" * 31):
+        try:
+            registry.get(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("malformed root accepted")
+
+
+@pytest.mark.parametrize("mutate, reason", [
+    (lambda e: "not an object", Rejection.INVALID_JSON),
+    (lambda e: e.update(kind=1) or e, Rejection.WRONG_KIND),
+    (lambda e: e.update(pubkey=7) or e, Rejection.MISSING_PUBKEY),
+    (lambda e: e.update(tags="root") or e, Rejection.MISSING_TAGS),
+    (lambda e: e.update(tags=e["tags"][:2]) or e, Rejection.MISSING_TAGS),
+    (lambda e: e["tags"][0].__setitem__(1, 5) or e, Rejection.MISSING_TAGS),
+    (lambda e: e["tags"][0].__setitem__(1, "ff" * 32) or e, Rejection.ROOT_MISMATCH),
+    (lambda e: e.update(pubkey="ab" * 31) or e, Rejection.BAD_LENGTH),
+    (lambda e: e["tags"][1].__setitem__(1, "00" * 10) or e, Rejection.BAD_LENGTH),
+    (lambda e: e.update(pubkey="zz" * 32) or e, Rejection.BAD_HEX),
+    (lambda e: e.update(pubkey="\u00e9" * 64) or e, Rejection.BAD_HEX),
+    (lambda e: e["tags"][2].__setitem__(1, "\ud800") or e, Rejection.BAD_LABEL),
+])
+def test_prevalidation_rejects_without_crypto(monkeypatch, mutate, reason):
+    event = mutate(make_events(["2025-Q1"])[0])
+    root = make_events(["x"])[0]["tags"][0][1]
+
+    def no_crypto(*args, **kwargs):
+        raise AssertionError("malformed event reached the crypto")
+
+    monkeypatch.setattr(lineage.root_keys, "get", no_crypto)
+    monkeypatch.setattr(lineage.bindings, "crypto_sign_open", no_crypto)
+    assert prevalidate_lineage(event, root) == reason
+    assert check_lineage(root, event) == reason
+    assert verify_lineage_batch([event], root) == [False]
+
+
+def test_rejection_is_a_plain_reason_string():
+    event = make_events(["2025-Q1"])[0]
+    root = root_of(event)
+    assert prevalidate_lineage(event) is None
+    assert prevalidate_lineage(event, root) is None
+    assert check_lineage(None, event) == "root_mismatch"
+
+    forged = copy.deepcopy(event)
+    forged["tags"][1][1] = "00" * 64
+    reason = check_lineage(root, forged)
+    assert reason is Rejection.BAD_SIGNATURE
+    assert reason == "bad_signature" and f"{reason}" == "bad_signature"
+    assert {reason: 1} == {"bad_signature": 1}
+
+
+def test_negative_cache_drops_known_forgeries(monkeypatch):
+    good, other = make_events(["a", "b"])
+    root = root_of(good)
+    forged = copy.deepcopy(other)
+    forged["tags"][1][1] = good["tags"][1][1]
+    short = copy.deepcopy(other)
+    short["pubkey"] = "ab" * 31
+
+    now = [0.0]
+    negative = NegativeLineageCache(ttl=10, clock=lambda: now[0])
+    positive = VerifiedLineageCache()
+    kw = dict(cache=positive, negative_cache=negative)
+
+    assert check_lineage(root, forged, source="wss://a", **kw) == "bad_signature"
+    assert check_lineage(root, short, source="wss://a", **kw) == "bad_length"
+    assert verify_lineage(root, good, source="wss://a", **kw)
+    # only signature failures are remembered, never in the positive cache
+    assert len(negative) == 1 and len(positive) == 1
+
+    calls = []
+    real_open = lineage.root_keys.get
+    monkeypatch.setattr(lineage.root_keys, "get", lambda h: calls.append(h) or real_open(h))
+    for source in ("wss://a", "wss://b", "wss://b"):
+        assert check_lineage(root, forged, source=source, **kw) == "bad_signature"
+    assert calls == []
+    assert negative.sources == {
+        "wss://a": {"rejected": 1, "dropped": 1},
+        "wss://b": {"rejected": 0, "dropped": 2},
+    }
+
+    now[0] = 11.0
+    assert check_lineage(root, forged, **kw) == "bad_signature"
+    assert len(calls) == 1
+    assert negative.stats()["hits"] == 3
+
+
+def test_negative_cache_is_bounded():
+    negative = NegativeLineageCache(maxsize=2, max_sources=1)
+    keys = [("r", str(i), "s") for i in range(3)]
+    for i, key in enumerate(keys):
+        negative.add(key, source=f"relay-{i}")
+    assert len(negative) == 2
+    assert not negative.contains(keys[0])
+    assert negative.contains(keys[2])
+    assert set(negative.sources) == {"relay-0", "other"}
+    assert negative.sources["other"]["rejected"] == 2
+
+
+MALFORMED_TAGS = [None, 5, "root", {"root": "ab"}, [None], [["root"]], [("root", "ab")], [5, ["sig"]]]
+
+
+def test_malformed_tags_are_rejected_by_every_entry_point(tmp_path):
+    from coldroot.chain import LineageIndex, resolve_current_epochs
+    from coldroot.reverse import EpochRootIndex
+    from coldroot.store import LineageStore
+
+    good = make_events(["2025-Q1"])[0]
+    root = root_of(good)
+    bad = [dict(good, tags=tags) for tags in MALFORMED_TAGS]
+
+    for event in bad:
+        assert lineage._extract_lineage_tags(event) == (None, None, None)
+        assert check_lineage(root, event) == "missing_tags"
+        assert prevalidate_lineage(event) == "missing_tags"
+    assert verify_lineage_batch(bad + [good], root) == [False] * len(bad) + [True]
+
+    index = LineageIndex()
+    assert [index.add(e) for e in bad + [good]] == [False] * len(bad) + [True]
+    assert resolve_current_epochs([root], bad + [good]) == {root: (good["pubkey"], "2025-Q1", good["created_at"])}
+    reverse = EpochRootIndex()
+    assert [reverse.add(e, verify=False) for e in bad + [good]] == [False] * len(bad) + [True]
+    with LineageStore(str(tmp_path / "lineage.db")) as store:
+        assert store.add_events(bad + [good]) == 1
@@ -0,0 +1,43 @@
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot import metrics
+from coldroot.lineage import verify_lineage
+from factories import make_event
+
+
+def test_disabled_by_default_records_nothing():
+    assert metrics.ACTIVE is None
+    event = make_event("a")
+    assert verify_lineage(event["tags"][0][1], event)
+    assert metrics.ACTIVE is None
+
+
+def test_stage_histograms_rejections_and_hooks():
+    m = metrics.enable()
+    seen = []
+    metrics.add_hook(lambda stage, seconds: seen.append(stage))
+    try:
+        event = make_event("a")
+        root = event["tags"][0][1]
+        assert verify_lineage(root, event)
+        assert not verify_lineage(root, dict(event, pubkey="00" * 32))
+        assert not verify_lineage(root, dict(event, kind=1))
+    finally:
+        metrics.disable()
+
+    assert m.results == {"valid": 1, "invalid": 2}
+    assert m.rejections == {"bad_signature": 1, "wrong_kind": 1}
+    assert m.stages["verify"].count == 2
+    assert m.stages["check"].count == 3
+    assert seen.count("check") == 3 and "hex_decode" in seen
+
+    text = m.to_prometheus()
+    assert 'coldroot_lineage_rejections_total{reason="bad_signature"} 1' in text
+    assert 'coldroot_stage_seconds_bucket{stage="check",le="+Inf"} 3' in text
+    assert 'coldroot_stage_seconds_count{stage="verify"} 2' in text
+    assert "# TYPE coldroot_stage_seconds histogram" in text
@@ -0,0 +1,69 @@
+import hashlib
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.core import derive_epoch_key
+from coldroot.lineage import verify_lineage
+from coldroot.nip01 import (
+    check_event,
+    check_ids,
+    compute_ids,
+    event_id,
+    serialize_event,
+    sign_event,
+    verify_event,
+)
+from coldroot.reference_api import build_lineage_event, derive_epoch_key as ref_derive_epoch_key, sk_to_pk
+from factories import SEED_HEX, make_event
+
+
+def test_canonical_serialization():
+    event = {"pubkey": "ab" * 32, "created_at": 1, "kind": 1, "tags": [["t", "é"]], "content": "a\n\"b\""}
+    expected = '[0,"' + "ab" * 32 + '",1,1,[["t","é"]],"a\\n\\"b\\""]'
+    assert serialize_event(event) == expected.encode("utf-8")
+    assert event_id(event) == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+
+
+def test_sign_and_verify_event():
+    event = make_event("2025-Q1", 100, signed=True)
+    epoch_sk, _ = derive_epoch_key(SEED_HEX, "2025-Q1")
+    root = event["tags"][0][1]
+    assert event["id"] == event_id(event)
+    assert verify_event(event)
+    # the event-level fields don't affect lineage verification
+    assert verify_lineage(root, event)
+
+    assert check_event(dict(event, content="x")) == "bad_id"
+    other = make_event("2025-Q2", 200, signed=True)
+    # §5: a lineage event signed by some other key than its pubkey
+    stolen = dict(event, sig=other["sig"])
+    assert check_event(stolen) == "bad_signature"
+    assert check_event(dict(event, sig="zz")) == "bad_hex"
+    assert check_event({"kind": 30001}) == "missing_fields"
+
+    try:
+        sign_event(dict(other), epoch_sk)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("signed with a key that is not the event pubkey")
+
+
+def test_batch_ids():
+    events = [make_event(str(i), i, signed=True) for i in range(20)]
+    assert compute_ids(events) == [e["id"] for e in events]
+    tampered = dict(events[3], created_at=0)
+    unsigned = {k: v for k, v in events[4].items() if k != "id"}
+    assert check_ids(events[:3] + [tampered, unsigned, {"kind": 1}]) == [True] * 3 + [False] * 3
+
+
+def test_reference_api_fills_id_and_sig():
+    root_sk = bytes.fromhex(SEED_HEX)
+    epoch_sk = ref_derive_epoch_key(root_sk, "2025-Q1")
+    event = build_lineage_event(root_sk, sk_to_pk(epoch_sk), "2025-Q1", epoch_sk=epoch_sk)
+    assert verify_event(event)
+    assert "id" not in build_lineage_event(root_sk, sk_to_pk(epoch_sk), "2025-Q1")
@@ -0,0 +1,49 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.lineage import verify_lineage_batch
+from coldroot.parallel import RECORD_SIZE, pack_lineage, verify_lineage_parallel
+from factories import numbered_events
+
+
+def mixed_events():
+    events = numbered_events(20)
+    events[3] = dict(events[3], pubkey=events[4]["pubkey"])
+    events[9] = dict(events[9], kind=1)
+    events[15] = copy.deepcopy(events[15])
+    events[15]["tags"][1][1] = "ab" * 64
+    return events
+
+
+def test_pack_lineage_is_fixed_width():
+    event = numbered_events(1)[0]
+    assert len(pack_lineage(None, event)) == RECORD_SIZE
+    assert pack_lineage("00" * 32, event) is None
+
+
+def test_parallel_matches_batch_in_input_order():
+    events = mixed_events()
+    expected = verify_lineage_batch(events)
+
+    assert verify_lineage_parallel(events, jobs=2, chunksize=3) == expected
+    assert verify_lineage_parallel(events, jobs=1) == expected
+    assert expected.count(False) == 3
+
+
+def test_parallel_with_caller_pool():
+    events = mixed_events()
+    root = events[0]["tags"][0][1]
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        first = verify_lineage_parallel(events, expected_roots=root, chunksize=4, executor=pool)
+        second = verify_lineage_parallel(events[:5], executor=pool)
+
+    assert first == verify_lineage_batch(events)
+    assert second == [True, True, True, False, True]
+    assert verify_lineage_parallel([]) == []
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.cache import NegativeLineageCache
+from coldroot.relay import LineageIngestor, LocalRelay
+from factories import make_event
+
+
+def test_ingest_stored_events_with_backpressure():
+    events = [make_event(str(i), i) for i in range(50)]
+    root = events[0]["tags"][0][1]
+    fresh = make_event("forged", 999)
+    forged = dict(fresh, tags=[fresh["tags"][0], events[1]["tags"][1], fresh["tags"][2]])
+    note = {"kind": 1, "pubkey": events[0]["pubkey"], "tags": [], "content": "hi", "created_at": 1}
+    # duplicates re-delivered by the relay are skipped before verification
+    stored = events + events[:10] + [forged, note]
+
+    async def scenario():
+        relay = LocalRelay(stored, queue_size=4)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ingestor = LineageIngestor(executor=pool, queue_size=8, batch_size=16)
+            conn = relay.connect()
+            await ingestor.ingest(conn, until_eose=True)
+            await conn.close()
+        return ingestor
+
+    ingestor = asyncio.run(scenario())
+    assert ingestor.stats == {
+        "received": 61, "skipped": 10, "dropped": 0, "accepted": 50, "rejected": 1, "malformed": 0
+    }
+    assert len(ingestor.index) == 50
+    assert ingestor.index.current_epoch(root)["pubkey"] == events[-1]["pubkey"]
+
+
+def test_ingest_live_events_until_close():
+    q1 = make_event("2025-Q1", 100)
+    q2 = make_event("2025-Q2", 200)
+    root = q1["tags"][0][1]
+
+    async def scenario():
+        relay = LocalRelay([q1])
+        ingestor = LineageIngestor()
+        conn = relay.connect()
+        task = asyncio.create_task(ingestor.ingest(conn))
+        await relay.publish(q2)
+        while len(ingestor.index) < 2:
+            await asyncio.sleep(0.01)
+        await relay.close()
+        await asyncio.wait_for(task, 5)
+        return ingestor
+
+    ingestor = asyncio.run(scenario())
+    assert ingestor.stats["accepted"] == 2
+    assert ingestor.index.current_epoch(root)["pubkey"] == q2["pubkey"]
+
+
+def test_negative_cache_drops_rebroadcast_forgeries():
+    good = make_event("good", 1)
+    fresh = make_event("forged", 2)
+    forged = dict(fresh, tags=[fresh["tags"][0], good["tags"][1], fresh["tags"][2]])
+    negative = NegativeLineageCache()
+
+    async def scenario(events, source):
+        ingestor = LineageIngestor(negative_cache=negative, batch_size=1)
+        conn = LocalRelay(events).connect()
+        await ingestor.ingest(conn, until_eose=True, source=source)
+        await conn.close()
+        return ingestor.stats
+
+    first = asyncio.run(scenario([forged, good], "relay-a"))
+    second = asyncio.run(scenario([forged, forged, good], "relay-b"))
+    assert (first["rejected"], first["dropped"], first["accepted"]) == (1, 0, 1)
+    assert (second["rejected"], second["dropped"], second["accepted"]) == (0, 2, 1)
+    assert negative.sources == {"relay-a": {"rejected": 1, "dropped": 0}, "relay-b": {"rejected": 0, "dropped": 2}}
+
+
+def test_malformed_events_do_not_stop_ingestion():
+    good = make_event("good", 1)
+    later = make_event("later", 2)
+    malformed = [
+        {"kind": 30001, "tags": None},
+        dict(good, tags=5),
+        dict(good, tags=[None, ["root"]]),
+        dict(good, pubkey=5),
+        dict(good, pubkey="zz" * 32),
+    ]
+
+    async def scenario():
+        ingestor = LineageIngestor(batch_size=2)
+        conn = LocalRelay(malformed[:1] + [good] + malformed[1:] + [later]).connect()
+        await ingestor.ingest(conn, until_eose=True)
+        await conn.close()
+        return ingestor
+
+    ingestor = asyncio.run(scenario())
+    assert ingestor.stats == {
+        "received": 7, "skipped": 0, "dropped": 0, "accepted": 2, "rejected": 5, "malformed": 5
+    }
+    assert len(ingestor.index) == 2
@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.chain import LineageIndex
+from coldroot.core import derive_epoch_key, signing_key_from_seed_hex
+from coldroot.lineage import make_lineage_event
+from coldroot.reverse import BloomFilter, EpochRootIndex
+from factories import OTHER_SEED_HEX, SEED_HEX, make_event
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    keys = [os.urandom(32).hex() for _ in range(5000)]
+    for k in keys:
+        bloom.add(k)
+
+    assert all(k in bloom for k in keys)
+    false_positives = sum(os.urandom(32).hex() in bloom for _ in range(20000))
+    assert false_positives < 20000 * 0.03
+
+
+def test_lookup_verified_events():
+    a, b = make_event("a", signed=True), make_event("b", seed_hex=OTHER_SEED_HEX, signed=True)
+    forged = dict(make_event("c", signed=True), pubkey=make_event("d")["pubkey"])
+    index = EpochRootIndex(capacity=100)
+
+    assert index.add(a) and index.add(b)
+    assert not index.add(forged)
+    assert index.lookup(a["pubkey"]) == a["tags"][0][1]
+    assert index.lookup(b["pubkey"]) == b["tags"][0][1]
+    assert index.lookup(forged["pubkey"]) is None
+    assert index.lookup("not hex") is None
+    assert a["pubkey"] in index and len(index) == 2
+    assert index.lookup(a["pubkey"].upper()) == a["tags"][0][1]
+
+
+def test_root_cannot_claim_another_roots_epoch_key():
+    victim = make_event("2025-Q1", signed=True)
+    attacker_sk = signing_key_from_seed_hex("ee" * 32)
+    _, victim_vk = derive_epoch_key(SEED_HEX, "2025-Q1")
+    # a valid root signature by the attacker over the victim's epoch pubkey,
+    # but the attacker cannot sign the event with the victim's epoch key
+    claim = make_lineage_event(attacker_sk, victim_vk, "2025-Q1", created_at=0)
+    claim.update(id=victim["id"], sig=victim["sig"])
+    index = EpochRootIndex(capacity=10)
+
+    assert not index.add(claim)
+    assert not index.add(dict(victim, id=None, sig=None))
+    assert index.add(victim)
+    assert index.lookup(victim["pubkey"]) == victim["tags"][0][1]
+
+
+def test_max_keys_and_conflicting_roots():
+    index = EpochRootIndex(capacity=10, max_keys=2)
+    pks = [os.urandom(32).hex() for _ in range(3)]
+
+    assert index.add_pubkey(pks[0], "aa" * 32)
+    assert index.add_pubkey(pks[0], "AA" * 32)   # same mapping again
+    assert not index.add_pubkey(pks[0], "bb" * 32)
+    assert index.add_pubkey(pks[1], "bb" * 32)
+    assert not index.add_pubkey(pks[2], "bb" * 32)
+    assert len(index) == 2
+
+
+def test_from_lineage_index():
+    chains = LineageIndex()
+    events = [make_event(str(i), i, signed=True) for i in range(3)]
+    events[2].pop("sig")
+    for e in events:
+        chains.add(e)
+
+    root = events[0]["tags"][0][1]
+    reverse = EpochRootIndex.from_lineage_index(chains, capacity=10)
+    assert [reverse.lookup(e["pubkey"]) for e in events] == [root, root, None]
+    trusted = EpochRootIndex.from_lineage_index(chains, verify=False, capacity=10)
+    assert [trusted.lookup(e["pubkey"]) for e in events] == [root] * 3
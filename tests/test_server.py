@@ -0,0 +1,134 @@
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.server import LineageService, start_server
+from factories import make_event
+
+
+async def exchange(reader, writer, request):
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def test_verify_and_resolve_over_unix_socket(tmp_path):
+    q1 = make_event("2025-Q1", 100)
+    q2 = make_event("2025-Q2", 200)
+    root = q1["tags"][0][1]
+    forged = dict(q2, pubkey=q1["pubkey"], tags=[q2["tags"][0], q2["tags"][1], ["epoch", "x"]])
+    path = str(tmp_path / "coldroot.sock")
+
+    async def scenario():
+        service = LineageService()
+        server = await start_server(service, path=path)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(path)
+            single = await exchange(reader, writer, {"op": "verify", "event": q1, "id": 7})
+            batch = await exchange(reader, writer, {"op": "verify", "events": [q2, forged, "junk"]})
+            resolved = await exchange(reader, writer, {"op": "resolve", "root": root})
+            many = await exchange(reader, writer, {"op": "resolve", "roots": [root, "00" * 32]})
+            bad = await exchange(reader, writer, {"op": "nope"})
+            writer.write(b"{broken\n")
+            broken = json.loads(await reader.readline())
+            stats = await exchange(reader, writer, {"op": "stats"})
+            writer.close()
+        return single, batch, resolved, many, bad, broken, stats
+
+    single, batch, resolved, many, bad, broken, stats = asyncio.run(scenario())
+
+    assert single == {"ok": True, "valid": True, "reason": None, "id": 7}
+    assert [r["valid"] for r in batch["results"]] == [True, False, False]
+    assert batch["results"][1]["reason"] == "bad_signature"
+    assert resolved["epoch"] == {"pubkey": q2["pubkey"], "label": "2025-Q2", "created_at": 200}
+    assert many["epochs"]["00" * 32] is None
+    assert not bad["ok"] and not broken["ok"]
+    assert stats["stats"]["events"] == 2
+
+
+def test_many_concurrent_clients(tmp_path):
+    events = [make_event(str(i), i) for i in range(20)]
+    path = str(tmp_path / "coldroot.sock")
+
+    async def client(event):
+        reader, writer = await asyncio.open_unix_connection(path)
+        response = await exchange(reader, writer, {"op": "verify", "event": event})
+        writer.close()
+        return response["valid"]
+
+    async def scenario():
+        service = LineageService()
+        server = await start_server(service, path=path)
+        async with server:
+            results = await asyncio.gather(*(client(e) for e in events * 3))
+        return results, service
+
+    results, service = asyncio.run(scenario())
+    assert all(results)
+    assert len(service.index) == 20
+    assert service.cache.hits >= 40
+
+
+def test_malformed_events_and_reuse_over_tcp(monkeypatch):
+    q1 = make_event("2025-Q1", 100)
+    q2 = make_event("2025-Q2", 200)
+    # valid root signatures, but the pubkey or the label was already used
+    pubkey_reused = dict(q1, tags=[q1["tags"][0], q1["tags"][1], ["epoch", "2025-Q3"]])
+    label_reused = dict(q2, tags=[q2["tags"][0], q2["tags"][1], ["epoch", "2025-Q1"]])
+
+    async def scenario():
+        service = LineageService()
+        server = await start_server(service, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            batch = await exchange(
+                reader, writer,
+                {"op": "verify", "events": [q1, {"kind": 30001, "tags": None}, dict(q2, tags=5), q1]},
+            )
+            reuse = await exchange(reader, writer, {"op": "verify", "events": [pubkey_reused, label_reused]})
+            monkeypatch.setattr(service, "verify_event", None)
+            crashed = await exchange(reader, writer, {"op": "verify", "event": q2, "id": 3})
+            alive = await exchange(reader, writer, {"op": "ping"})
+            writer.close()
+        return batch, reuse, crashed, alive, len(service.index)
+
+    batch, reuse, crashed, alive, indexed = asyncio.run(scenario())
+
+    assert [(r["valid"], r["reason"]) for r in batch["results"]] == [
+        (True, None), (False, "missing_tags"), (False, "missing_tags"), (True, None)
+    ]
+    assert [r["reason"] for r in reuse["results"]] == ["pubkey_reused", "label_reused"]
+    assert crashed == {"ok": False, "error": "internal error: TypeError", "id": 3}
+    assert alive == {"ok": True}
+    assert indexed == 1
+
+
+def test_unix_socket_is_owner_only_and_other_files_are_kept(tmp_path):
+    path = tmp_path / "coldroot.sock"
+
+    async def start():
+        server = await start_server(LineageService(), path=str(path))
+        mode = path.stat().st_mode & 0o777
+        server.close()
+        await server.wait_closed()
+        return mode
+
+    assert asyncio.run(start()) == 0o600
+    # a stale socket from an earlier run is replaced
+    assert asyncio.run(start()) == 0o600
+
+    path.unlink()
+    path.write_text("not a socket")
+    try:
+        asyncio.run(start())
+    except FileExistsError:
+        pass
+    else:
+        raise AssertionError("replaced a regular file with the socket")
+    assert path.read_text() == "not a socket"
@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.chain import resolve_current_epochs
+from coldroot.shard import HashRing, ShardedResolver
+from factories import make_events
+
+
+def test_adding_a_node_moves_about_one_nth_of_keys():
+    keys = [f"{i:064x}" for i in range(20000)]
+    ring = HashRing([f"worker-{i}" for i in range(4)])
+    before = {k: ring.node_for(k) for k in keys}
+    ring.add("worker-4")
+    moved = [k for k in keys if ring.node_for(k) != before[k]]
+
+    assert 0.12 < len(moved) / len(keys) < 0.28
+    # keys only ever move to the new node
+    assert {ring.node_for(k) for k in moved} == {"worker-4"}
+    counts = {n: sum(1 for k in keys if ring.node_for(k) == n) for n in ring.nodes}
+    assert min(counts.values()) > 0.5 * len(keys) / 5
+
+
+def test_sharded_resolver_routes_resolves_and_rebalances():
+    seeds = [bytes([i]) * 32 for i in range(1, 13)]
+    events = [e for seed in seeds for e in make_events(["2025-Q1", "2025-Q2"], seed.hex(), created_at=100)]
+    roots = [e["tags"][0][1] for e in events[::2]]
+    forged = dict(events[1], tags=[events[1]["tags"][0], events[0]["tags"][1], events[1]["tags"][2]])
+    expected = resolve_current_epochs(roots, events)
+
+    with ShardedResolver(workers=2) as resolver:
+        malformed = [{"kind": 30001}, dict(events[0], tags=None), dict(events[0], tags=[5, ["root"]])]
+        assert resolver.add_events(events + [forged] + malformed) == [True] * len(events) + [False] * 4
+        # re-delivered events are rejected by the owning worker
+        assert resolver.add(events[0]) is False
+        assert len(resolver) == len(events)
+        assert resolver.resolve(roots + ["00" * 32]) == expected
+        assert resolver.current_epoch(roots[0].upper()) == expected[roots[0]]
+
+        owners = {root: resolver.owner(root) for root in roots}
+        moved = resolver.add_worker()
+        assert moved == sum(1 for r in roots if resolver.owner(r) != owners[r])
+        assert moved < len(roots)
+        assert resolver.resolve(roots) == expected
+        stats = resolver.stats()
+        assert set(stats) == {"worker-0", "worker-1", "worker-2"}
+        assert stats["worker-2"]["roots"] == moved
+        assert sum(s["events"] for s in stats.values()) == len(events)
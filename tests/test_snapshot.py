@@ -0,0 +1,92 @@
+import asyncio
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot import chain
+from coldroot.chain import LineageIndex
+from coldroot.server import LineageService
+from coldroot.snapshot import HEADER, load_snapshot, save_snapshot
+from factories import make_event
+
+
+def test_round_trip_and_warm_start(tmp_path, monkeypatch):
+    history = [make_event(str(i), i) for i in range(10)]
+    root = history[0]["tags"][0][1]
+    index = LineageIndex()
+    for event in history:
+        assert index.add(event)
+    path = str(tmp_path / "state.snap")
+    assert save_snapshot(index, path) == 9
+    assert not (tmp_path / "state.snap.tmp").exists()
+
+    verified = []
+    real_verify = chain.verify_lineage
+    monkeypatch.setattr(chain, "verify_lineage", lambda *a, **k: verified.append(1) or real_verify(*a, **k))
+
+    restored, watermark = load_snapshot(path)
+    assert watermark == 9
+    assert len(restored) == 10
+    assert restored.current_epoch(root) == history[-1]
+    assert restored.chain(root).has_label("3")
+    assert verified == []
+
+    # replayed history is skipped, only new events are verified
+    new = make_event("10", 10)
+    for event in history + [new]:
+        restored.add(event)
+    assert verified == [1]
+    assert restored.current_epoch(root) == new
+
+
+def test_rejects_corrupt_snapshot(tmp_path):
+    index = LineageIndex()
+    index.add(make_event("2025-Q1", 1))
+    path = tmp_path / "state.snap"
+    save_snapshot(index, str(path), watermark=1234)
+    assert load_snapshot(str(path))[1] == 1234
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 1
+    path.write_bytes(bytes(data))
+    try:
+        load_snapshot(str(path))
+    except ValueError as exc:
+        assert "hash" in str(exc)
+    else:
+        raise AssertionError("loaded a snapshot with a bad hash")
+
+    data[4] = 9
+    path.write_bytes(bytes(data))
+    try:
+        load_snapshot(str(path))
+    except ValueError as exc:
+        assert "version" in str(exc)
+    else:
+        raise AssertionError("loaded an unsupported version")
+
+    path.write_bytes(b"x" * HEADER.size)
+    try:
+        load_snapshot(str(path))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("loaded a file without the snapshot magic")
+
+
+def test_service_snapshot_op(tmp_path):
+    path = str(tmp_path / "state.snap")
+    service = LineageService(snapshot_path=path)
+    event = make_event("2025-Q1", 100)
+
+    async def scenario():
+        await service.handle({"op": "verify", "event": event})
+        return await service.handle({"op": "snapshot"})
+
+    assert asyncio.run(scenario()) == {"ok": True, "watermark": 100}
+    index, _ = load_snapshot(path)
+    assert index.current_epoch(event["tags"][0][1]) == event
+    assert asyncio.run(LineageService().handle({"op": "snapshot"}))["ok"] is False
@@ -0,0 +1,49 @@
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE = ROOT / "examples" / "lineage_2026Q1.json"
+
+
+def importtime(*args):
+    """
+    Run python -X importtime and return ({module: cumulative_us}, proc).
+    Only the set of imported modules is asserted on; import times depend
+    on the machine.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules, proc
+
+
+def test_cli_import_stays_light():
+    modules, _ = importtime("-c", "import coldroot.cli; coldroot.cli.build_parser()")
+
+    assert not [m for m in modules if m == "nacl" or m.startswith("nacl.")]
+    assert sorted(m for m in modules if m.startswith("coldroot")) == ["coldroot", "coldroot.cli"]
+    assert "concurrent.futures" not in modules
+
+
+def test_help_does_not_import_crypto():
+    modules, proc = importtime("-m", "coldroot.cli", "--help")
+    assert proc.returncode == 0
+    assert "nacl" not in modules
+
+
+def test_verify_imports_only_what_it_uses():
+    modules, proc = importtime("-m", "coldroot.cli", "verify", str(EXAMPLE))
+    assert proc.stdout.strip() == "valid"
+    assert "coldroot.lineage" in modules
+    for unused in ("coldroot.parallel", "coldroot.chain", "coldroot.bundle", "concurrent.futures"):
+        assert unused not in modules
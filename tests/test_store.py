@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+
+# Add repo root so we can import coldroot.*
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from coldroot.store import LineageStore
+from factories import make_event
+
+
+def test_store_queries_and_reuse(tmp_path):
+    q1 = make_event("2025-Q1", 100)
+    q2 = make_event("2025-Q2", 200)
+    root = q1["tags"][0][1]
+    forged = dict(q2, tags=[q2["tags"][0], q1["tags"][1], q2["tags"][2]])
+    relabeled = make_event("other", 300)
+    relabeled["tags"][2] = ["epoch", "2025-Q1"]
+
+    with LineageStore(str(tmp_path / "lineage.db"), batch_size=1) as store:
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.add_events([q2, forged, q1, q1]) == 2
+        # label reuse is rejected by the unique constraint
+        assert store.add(relabeled, verify=False) is False
+
+        assert len(store) == 2
+        assert store.current_epoch(root.upper())["pubkey"] == q2["pubkey"]
+        assert [e["pubkey"] for e in store.history(root)] == [q1["pubkey"], q2["pubkey"]]
+        assert store.root_of(q1["pubkey"]) == root
+        assert store.root_of("00" * 32) is None
+        assert store.by_label("2025-Q2") == [q2]
+        assert list(store.since(150)) == [q2]
+        assert store.roots() == [root]
+        assert store.current_epoch("11" * 32) is None
+
+
+def test_load_index_skips_verification(tmp_path, monkeypatch):
+    events = [make_event(str(i), i) for i in range(5)]
+    root = events[0]["tags"][0][1]
+    path = str(tmp_path / "lineage.db")
+    with LineageStore(path) as store:
+        assert store.add_events(events) == 5
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stored rows must not be re-verified")
+
+    monkeypatch.setattr("coldroot.chain.verify_lineage", fail)
+    with LineageStore(path) as store:
+        index = store.load_index()
+    assert len(index) == 5
+    assert index.current_epoch(root)["pubkey"] == events[-1]["pubkey"]